@@ -3,9 +3,14 @@
 Check Spotify API access levels
 """
 import os
+import asyncio
+import aiohttp
 from dotenv import load_dotenv
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials, SpotifyOAuth
+from spotipy.oauth2 import SpotifyOAuth
+
+API_BASE = "https://api.spotify.com/v1"
+TEST_TRACK_ID = "3z8h0TU7ReDPLIbEnYhWZb"  # Bohemian Rhapsody
+TEST_ARTIST_ID = "3TV7tssuSl8x7ARqsTvIyM"
 
 load_dotenv()
 
@@ -19,58 +24,61 @@ print(f"Username: {username}\n")
 
 # Test with user authentication
 scope = "user-read-private playlist-read-private"
-sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
+auth_manager = SpotifyOAuth(
     client_id=client_id,
     client_secret=client_secret,
     redirect_uri=os.getenv('SPOTIPY_REDIRECT_URI'),
     scope=scope,
     username=username
-))
+)
+token = auth_manager.get_access_token(as_dict=False)
 
-print("Testing API endpoints:\n")
 
-# Test 1: Basic user profile (should always work)
-try:
-    user = sp.current_user()
-    print("✅ User Profile: OK")
-except Exception as e:
-    print(f"❌ User Profile: FAILED - {e}")
+async def probe(session, name, path, params=None, check=None, fail_label="FAILED", short_error=False):
+    """Call one endpoint and return the formatted result line."""
+    try:
+        async with session.get(f"{API_BASE}{path}", params=params) as resp:
+            data = await resp.json(content_type=None)
+            if resp.status >= 400:
+                # Spotify nests the message; OAuth errors use a plain string
+                error = data.get('error') if isinstance(data, dict) else None
+                message = error.get('message', '') if isinstance(error, dict) else (error or '')
+                raise Exception(f"http status: {resp.status}, {message}")
+    except Exception as e:
+        detail = str(e)[:100] if short_error else e
+        return f"❌ {name}: {fail_label} - {detail}"
+
+    if check and not check(data):
+        return f"⚠️  {name}: Returns empty"
+    return f"✅ {name}: OK"
 
-# Test 2: Search (should always work)
-try:
-    results = sp.search(q="test", type="track", limit=1)
-    print("✅ Search: OK")
-except Exception as e:
-    print(f"❌ Search: FAILED - {e}")
 
-# Test 3: Audio Features (blocked for you)
-try:
-    # Use a known track ID (Bohemian Rhapsody)
-    features = sp.audio_features(["3z8h0TU7ReDPLIbEnYhWZb"])
-    if features and features[0]:
-        print("✅ Audio Features: OK")
-    else:
-        print("⚠️  Audio Features: Returns empty")
-except Exception as e:
-    print(f"❌ Audio Features: BLOCKED - {str(e)[:100]}")
+async def run_probes():
+    """Run all endpoint checks concurrently, returning results in order."""
+    headers = {'Authorization': f'Bearer {token}'}
+    async with aiohttp.ClientSession(headers=headers) as session:
+        return await asyncio.gather(
+            # Test 1: Basic user profile (should always work)
+            probe(session, "User Profile", "/me"),
+            # Test 2: Search (should always work)
+            probe(session, "Search", "/search", params={'q': 'test', 'type': 'track', 'limit': 1}),
+            # Test 3: Audio Features (blocked for you)
+            probe(session, "Audio Features", "/audio-features", params={'ids': TEST_TRACK_ID},
+                  check=lambda d: d and d.get('audio_features') and d['audio_features'][0],
+                  fail_label="BLOCKED", short_error=True),
+            # Test 4: Recommendations (blocked for you)
+            probe(session, "Recommendations", "/recommendations", params={'seed_tracks': TEST_TRACK_ID, 'limit': 5},
+                  check=lambda d: d and 'tracks' in d,
+                  fail_label="BLOCKED", short_error=True),
+            # Test 5: Get Artist
+            probe(session, "Artist Info", f"/artists/{TEST_ARTIST_ID}"),
+        )
 
-# Test 4: Recommendations (blocked for you)
-try:
-    recs = sp.recommendations(seed_tracks=["3z8h0TU7ReDPLIbEnYhWZb"], limit=5)
-    if recs and 'tracks' in recs:
-        print("✅ Recommendations: OK")
-    else:
-        print("⚠️  Recommendations: Returns empty")
-except Exception as e:
-    print(f"❌ Recommendations: BLOCKED - {str(e)[:100]}")
 
-# Test 5: Get Artist
-try:
-    artist = sp.artist("3TV7tssuSl8x7ARqsTvIyM")
-    if artist:
-        print("✅ Artist Info: OK")
-except Exception as e:
-    print(f"❌ Artist Info: FAILED - {e}")
+print("Testing API endpoints:\n")
+
+for line in asyncio.run(run_probes()):
+    print(line)
 
 print("\n" + "="*50)
 print("📊 Summary:")
@@ -7,32 +7,123 @@ import os
 import time
 import logging
 import re
-import json
-from datetime import datetime
+import asyncio
+import random
+from urllib.parse import urlencode
+import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
-import discogs_client
 from constants import (
     DISCOGS_RATE_LIMIT_PER_MINUTE,
     DISCOGS_MAX_RETRIES,
     DISCOGS_RETRY_AFTER_BUFFER,
+    DISCOGS_CONCURRENCY,
+    DISCOGS_REQUEST_TIMEOUT,
+    DISCOGS_SEARCH_PAGE_LIMIT,
+    CONFIDENCE_LABEL_SEARCH,
+    CACHE_DEFAULT_EXPIRY_DAYS,
+    CACHE_SQLITE_PATH,
+    CACHE_DISCOGS_MAX_ENTRIES,
 )
+from utils.sqlite_cache import DiscogsResponseCache
+from utils.rate_limiter import get_rate_limiter
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+except ImportError:
+    rf_fuzz = rf_process = None
 
 logger = logging.getLogger('discogs_client')
 
+DISCOGS_API_BASE = 'https://api.discogs.com'
+DISCOGS_USER_AGENT = 'PlaylistCreatorApp/1.0'
+DISCOGS_RELEASES_PER_PAGE = 100  # Max allowed by API
+
+_LABEL_URL_RE = re.compile(r'/label/(\d+)')
+_LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)')
+_RATE_RE = re.compile(r'after:\s*(\d+)', re.I)
+_RATE_KEYWORDS = ('rate limit', 'ratelimit', 'too many')
+
+
+def _extract_total_pages(pagination):
+    """
+    Read the total page count from Discogs pagination info.
+
+    Accepts either the raw JSON dict or an object and tries ``pages``,
+    then ``items``/``per_page``, then the ``last`` URL. Returns 1 if none
+    of them are available.
+    """
+    if pagination is None:
+        return 1
+    if isinstance(pagination, dict):
+        get = pagination.get
+    else:
+        get = lambda name, default=None: getattr(pagination, name, default)
+
+    pages = get('pages')
+    if pages:
+        return int(pages)
+
+    items = get('items')
+    if items:
+        per_page = get('per_page') or DISCOGS_RELEASES_PER_PAGE
+        return -(-int(items) // int(per_page))
+
+    match = _LAST_PAGE_RE.search((get('urls') or {}).get('last', ''))
+    if match:
+        return int(match.group(1))
+
+    return 1
+
+
+class DiscogsAPIError(Exception):
+    """HTTP error returned by the Discogs REST API."""
+
+    def __init__(self, status_code, message, headers=None):
+        super().__init__(f"{status_code}: {message}")
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class DiscogsLabel:
+    """Lightweight label built from the /labels/{id} JSON response."""
+
+    def __init__(self, data):
+        self.data = data
+        self.id = data['id']
+        self.name = data.get('name', '')
+
+    def __repr__(self):
+        return f"<DiscogsLabel {self.id} {self.name!r}>"
+
+
 class DiscogsClient:
     """
-    A robust wrapper around the Discogs API client.
+    A robust client for the Discogs REST API.
     
     Implements rate limiting, error handling, and useful helper methods.
+    Lookups go straight to the documented JSON endpoints; the
+    discogs_client SDK is only used to verify the token.
     """
     
-    def __init__(self, user_token=None, cache_manager=None):
+    def __init__(self, user_token=None, cache_manager=None, limiter=None):
         """
         Initialize the Discogs client with the user token.
         
         Args:
             user_token: Discogs API user token (defaults to env var)
             cache_manager: Optional cache manager instance
+            limiter: Optional RateLimiter (defaults to the shared process-wide one)
         """
         load_dotenv()
         self.user_token = user_token or os.getenv('DISCOGS_USER_TOKEN')
@@ -42,18 +133,41 @@ class DiscogsClient:
             logger.warning("Discogs user token not provided. Some features will be disabled.")
             self.client = None
         else:
-            self.client = discogs_client.Client('PlaylistCreatorApp/1.0', user_token=self.user_token)
+            # Imported lazily so commands that never touch Discogs don't pay for it
+            import discogs_client
+            self.client = discogs_client.Client(DISCOGS_USER_AGENT, user_token=self.user_token)
             
         self.cache_manager = cache_manager
         
+        # Shared HTTP session so TCP/TLS connections are reused across requests
+        self._http = requests.Session()
+        self._http.headers.update({
+            'Authorization': f'Discogs token={self.user_token}',
+            'User-Agent': DISCOGS_USER_AGENT,
+        })
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(DISCOGS_CONCURRENCY, 10))
+        self._http.mount('https://', adapter)
+        
+        # Response cache for individual API lookups (labels, release pages)
+        try:
+            self.response_cache = DiscogsResponseCache(
+                db_path=CACHE_SQLITE_PATH,
+                expiry_days=CACHE_DEFAULT_EXPIRY_DAYS,
+                max_entries=CACHE_DISCOGS_MAX_ENTRIES,
+            )
+        except Exception as e:
+            logger.warning(f"Discogs response cache disabled: {e}")
+            self.response_cache = None
+        
         # Initialize rate limiting parameters - more conservative defaults
         self.rate_limit_per_minute = DISCOGS_RATE_LIMIT_PER_MINUTE  # Default (Discogs recommends below 60)
-        self.min_request_interval = 60.0 / self.rate_limit_per_minute  # Dynamic calculation
         self.last_request_time = 0
         
-        # Token bucket for rate limiting
-        self.token_bucket = self.rate_limit_per_minute  # Start with full bucket
-        self.bucket_last_updated = time.time()
+        # Token bucket lives in the shared limiter so every client draws on one budget
+        self.limiter = limiter or get_rate_limiter()
+        
+        # Previous backoff delay for decorrelated-jitter retries
+        self._prev_backoff = 1.0
 
         # Test the connection if client exists
         if self.client:
@@ -64,48 +178,44 @@ class DiscogsClient:
                 logger.error(f"Failed to authenticate with Discogs: {e}")
                 # Don't raise, just log
     
-    def _update_token_bucket(self):
-        """Update token bucket based on elapsed time."""
-        now = time.time()
-        elapsed = now - self.bucket_last_updated
-        
-        # Add tokens based on elapsed time
-        new_tokens = elapsed * (self.rate_limit_per_minute / 60.0)
-        self.token_bucket = min(self.rate_limit_per_minute, self.token_bucket + new_tokens)
-        self.bucket_last_updated = now
-
     def _wait_for_rate_limit(self):
         """
-        Implement more efficient token bucket algorithm for rate limiting.
+        Wait for a token from the shared Discogs bucket.
         """
-        # Update token bucket first
-        self._update_token_bucket()
-        
-        # Smarter approach: Only wait if we're below threshold
-        if self.token_bucket < 1:
-            # Calculate how much time needed until we have a token
-            seconds_needed = (1 - self.token_bucket) * (60.0 / self.rate_limit_per_minute)
-            
-            # Add a small buffer to be safe
-            wait_time = seconds_needed + 0.1
-            
-            # Sleep for the calculated time instead of polling
-            time.sleep(wait_time)
-            
-            # Update bucket after sleep
-            self._update_token_bucket()
-    
-        # Consume one token
-        self.token_bucket -= 1
+        self.limiter.wait('discogs')
+        self.last_request_time = time.time()
+
+    async def _async_rate_limit(self):
+        """
+        Async counterpart of _wait_for_rate_limit sharing the same token bucket.
+        """
+        await self.limiter.acquire('discogs')
         self.last_request_time = time.time()
     
-    def _request_with_backoff(self, func, *args, max_retries=DISCOGS_MAX_RETRIES, **kwargs):
+    def _next_backoff(self):
+        """
+        Next retry delay using decorrelated jitter, so parallel retries spread out.
+        """
+        self._prev_backoff = min(60, random.uniform(1.0, self._prev_backoff * 3))
+        return self._prev_backoff
+
+    def _request_with_backoff(self, func, *args, max_retries=DISCOGS_MAX_RETRIES, cache_url=None, **kwargs):
         """
         Execute a Discogs API call with exponential backoff for failures.
+
+        When ``cache_url`` is given the call must return JSON-serializable data;
+        a cached response is returned without consuming a rate-limit token and
+        successful results are stored under that URL.
         """
-        if not self.client:
+        if not self.user_token:
             raise RuntimeError("Discogs client not initialized (missing token)")
 
+        if cache_url and self.response_cache:
+            cached = self.response_cache.get(cache_url)
+            if cached is not None:
+                logger.debug(f"Discogs cache hit: {cache_url}")
+                return cached
+
         retry = 0
         while retry <= max_retries:
             try:
@@ -113,21 +223,10 @@ class DiscogsClient:
                 self._wait_for_rate_limit()
                 result = func(*args, **kwargs)
                 
-                # Adjust rate limiting based on headers if available
-                try:
-                    if hasattr(result, '_resp'):
-                        remaining = int(result._resp.headers.get('X-Discogs-Ratelimit-Remaining', 60))
-                        
-                        # Dynamically adjust request interval based on remaining limit
-                        if remaining < 5:
-                            self.min_request_interval = 5.0  # Slow down significantly
-                        elif remaining < 20:
-                            self.min_request_interval = 2.0  # Slow down moderately
-                        else:
-                            self.min_request_interval = 1.0  # Normal speed
-                except (AttributeError, ValueError):
-                    pass
-                    
+                if cache_url and self.response_cache:
+                    self.response_cache.set(cache_url, result)
+                
+                self._prev_backoff = 1.0
                 return result
                 
             except Exception as e:
@@ -144,41 +243,66 @@ class DiscogsClient:
                 if hasattr(e, 'status_code') and e.status_code == 429:
                     rate_limited = True
                     wait_time = int(getattr(e, 'headers', {}).get('Retry-After', 60))
-                elif str(e).lower().find('rate') >= 0 and str(e).lower().find('limit') >= 0:
+                elif any(k in (msg := str(e).lower()) for k in _RATE_KEYWORDS):
                     rate_limited = True
                     # Try to extract the wait time from the error message
-                    match = re.search(r'after:\s*(\d+)', str(e))
+                    match = _RATE_RE.search(msg)
                     if match:
                         wait_time = int(match.group(1))
                     else:
-                        wait_time = min(60, 5 * (2 ** retry))
+                        wait_time = None
                 
                 if retry <= max_retries:
-                    if rate_limited:
-                        # Use the provided wait time + a small buffer
-                        wait_time = wait_time + 1
+                    if rate_limited and wait_time is not None:
+                        # Honour the server-provided wait time exactly, plus a small buffer
+                        wait_time = wait_time + DISCOGS_RETRY_AFTER_BUFFER
                         logger.warning(f"Discogs rate limit hit. Waiting {wait_time}s (retry {retry}/{max_retries})")
+                    elif rate_limited:
+                        wait_time = self._next_backoff()
+                        logger.warning(f"Discogs rate limit hit. Waiting {wait_time:.1f}s (retry {retry}/{max_retries})")
                     else:
-                        # Use exponential backoff for other errors
-                        wait_time = min(60, 2 ** retry)
-                        logger.warning(f"Discogs API error: {e}. Waiting {wait_time}s (retry {retry}/{max_retries})")
+                        # Use jittered backoff for other errors
+                        wait_time = self._next_backoff()
+                        logger.warning(f"Discogs API error: {e}. Waiting {wait_time:.1f}s (retry {retry}/{max_retries})")
                     
                     # Wait for the required time
                     time.sleep(wait_time)
-                    
-                    # Increase the minimum request interval
-                    self.min_request_interval = max(self.min_request_interval, 1.0 + (retry * 0.5))
                 else:
                     logger.error(f"Maximum retries reached for Discogs request: {e}")
                     raise
     
         raise Exception("Maximum retries reached for Discogs request")
+
+    def _api_url(self, path, params=None):
+        """Build the canonical request URL, used as both target and cache key."""
+        url = f"{DISCOGS_API_BASE}{path}"
+        if params:
+            url = f"{url}?{urlencode(sorted(params.items()))}"
+        return url
+
+    def _api_get(self, url):
+        """
+        Perform a single GET against the Discogs REST API and decode the JSON body.
+        """
+        resp = self._http.get(url, timeout=DISCOGS_REQUEST_TIMEOUT)
+        if resp.status_code >= 400:
+            raise DiscogsAPIError(resp.status_code, resp.reason, resp.headers)
+        return orjson.loads(resp.content) if orjson is not None else resp.json()
+
+    def _get_json(self, path, params=None, use_response_cache=True):
+        """
+        Fetch a Discogs endpoint with rate limiting, retries and response caching.
+        """
+        url = self._api_url(path, params)
+        return self._request_with_backoff(
+            self._api_get, url, cache_url=url if use_response_cache else None
+        )
     
     def find_label_by_url(self, url):
         """Find a Discogs label by URL."""
         try:
             # Extract label ID from URL
-            match = re.search(r'/label/(\d+)', url)
+            match = _LABEL_URL_RE.search(url)
             if not match:
                 logger.warning(f"Could not extract label ID from URL: {url}")
                 return None
@@ -186,7 +310,7 @@ class DiscogsClient:
             label_id = int(match.group(1))
             
             # Fetch the label
-            label = self._request_with_backoff(lambda: self.client.label(label_id))
+            label = self._fetch_label(label_id)
             logger.info(f"Found label via URL: {label.name}")
             return label
             
@@ -198,47 +322,42 @@ class DiscogsClient:
         """Find a Discogs label by name."""
         try:
             # Search for the label
-            results = self._request_with_backoff(
-                lambda: self.client.search(name, type='label')
-            )
+            data = self._get_json('/database/search', {'q': name, 'type': 'label'})
+            results = data.get('results', [])
             
-            if not results or len(results) == 0:
+            if not results:
                 logger.warning(f"No labels found for name: {name}")
                 return None
                 
-            # Find the best match in search results
+            # Find the best match in the first page of search results
             best_match = None
+            name_lc = name.lower()
             
-            for result in results:
-                # Check the attribute that actually exists (discogs search results use 'title')
-                result_name = None
-                if hasattr(result, 'title'):
-                    result_name = result.title
-                elif hasattr(result, 'name'):
-                    result_name = result.name
-                
-                if result_name and result_name.lower() == name.lower():
-                    best_match = result
-                    break
+            # Search results carry the label name in 'title'
+            candidates = [(r['title'].lower(), r) for r in results if r.get('title') and 'id' in r]
+            
+            if candidates:
+                if rf_process is not None:
+                    match = rf_process.extractOne(
+                        name_lc,
+                        [candidate_name for candidate_name, _ in candidates],
+                        scorer=rf_fuzz.WRatio,
+                        score_cutoff=CONFIDENCE_LABEL_SEARCH,
+                    )
+                    if match:
+                        best_match = candidates[match[2]][1]
+                else:
+                    best_match = next((r for n, r in candidates if n == name_lc), None)
             
             # Use first result if no exact match found
-            if not best_match and len(results) > 0:
-                best_match = results[0]
+            if not best_match and candidates:
+                best_match = candidates[0][1]
                 
-            # If we have a match, get the full label object
+            # If we have a match, get the full label
             if best_match:
-                try:
-                    # Results contain objects with 'id' attribute - we need this to get the full label
-                    label_id = best_match.id
-                    label = self._request_with_backoff(lambda: self.client.label(label_id))
-                    logger.info(f"Found label by name: {label.name}")
-                    return label
-                except AttributeError:
-                    # Fall back to direct fetch if ID isn't available
-                    logger.warning(f"Search result missing ID attribute, trying direct label fetch")
-                    labels = self.client.search(name, type='label')
-                    if labels and len(labels) > 0:
-                        return self.client.label(labels[0].id)
+                label = self._fetch_label(best_match['id'])
+                logger.info(f"Found label by name: {label.name}")
+                return label
             
             return None
                 
@@ -246,9 +365,18 @@ class DiscogsClient:
             logger.error(f"Error finding label by name {name}: {e}")
             return None
     
+    def _fetch_label(self, label_id):
+        """
+        Fetch a label by ID through the response cache.
+        """
+        return DiscogsLabel(self._get_json(f'/labels/{label_id}'))
+
     def get_all_label_releases(self, label, cache_key=None, force_update=False):
         """
         Get all releases for a label with intelligent caching and rate limiting.
+
+        Pages are fetched concurrently over aiohttp when it is installed,
+        otherwise sequentially.
         """
         # Check cache first unless force update is specified
         if cache_key and not force_update:
@@ -258,104 +386,21 @@ class DiscogsClient:
                 return cached_data
 
         try:
-            releases = []
-            
             # Get releases with the correct pagination API
             logger.info(f"Fetching releases for {label.name} from Discogs API")
-            
-            # Get the releases object
-            releases_obj = self._request_with_backoff(
-                lambda: self.client.label(label.id).releases
-            )
-            
-            # Configure pagination parameters on the releases object
-            releases_obj.per_page = 100  # Max allowed by API
-            
-            # Get first page
-            first_page = self._request_with_backoff(
-                lambda: releases_obj.page(1)
-            )
-            
-            # Extract pagination information
-            total_pages = 1
-            
-            # Try all known pagination patterns in Discogs client responses
-            if hasattr(first_page, 'pagination'):
-                pagination = first_page.pagination
-                
-                if hasattr(pagination, 'pages'):
-                    total_pages = pagination.pages
-                elif hasattr(pagination, 'items') and pagination.items:
-                    items_per_page = getattr(pagination, 'per_page', 100)
-                    total_items = pagination.items
-                    total_pages = (total_items + items_per_page - 1) // items_per_page
-                elif hasattr(pagination, 'urls') and pagination.urls:
-                    if 'last' in pagination.urls:
-                        try:
-                            from urllib.parse import urlparse, parse_qs
-                            parsed = urlparse(pagination.urls['last'])
-                            query = parse_qs(parsed.query)
-                            if 'page' in query and query['page']:
-                                total_pages = int(query['page'][0])
-                        except Exception as e:
-                            logger.warning(f"Failed to parse pagination URL: {e}")
 
-            # If we still only have 1 page but there are clearly more items than per_page
-            if total_pages == 1 and len(first_page) >= releases_obj.per_page:
-                try:
-                    second_page = self._request_with_backoff(
-                        lambda: releases_obj.page(2)
-                    )
-                    if second_page and len(second_page) > 0:
-                        total_pages = 2
-                        for probe_page in range(3, 10):  # Try up to page 10
-                            try:
-                                next_page = self._request_with_backoff(
-                                    lambda: releases_obj.page(probe_page)
-                                )
-                                if next_page and len(next_page) > 0:
-                                    total_pages = probe_page
-                                else:
-                                    break
-                            except Exception:
-                                break
-                        logger.debug(f"Found {total_pages} pages through probing")
-                except Exception as e:
-                    logger.debug(f"Second page probe failed: {e}")
-        
-            logger.info(f"Found {total_pages} pages of releases for {label.name}")
-            
-            # Process first page results
-            for release in first_page:
-                processed = self._process_release(release)
-                if processed:
-                    releases.append(processed)
-        
-            # Process remaining pages
-            for page in range(2, total_pages + 1):
+            releases = None
+            if aiohttp is not None and self.user_token:
                 try:
-                    logger.info(f"Fetching page {page}/{total_pages}...")
-                    # Use the properly configured releases object for pagination
-                    page_releases = self._request_with_backoff(
-                        lambda: releases_obj.page(page)
+                    releases = asyncio.run(
+                        self.get_all_label_releases_async(label, use_response_cache=not force_update)
                     )
-                    
-                    if not page_releases:
-                        logger.warning(f"No releases found on page {page}")
-                        continue
-                    
-                    # Process releases on this page
-                    for release in page_releases:
-                        processed = self._process_release(release)
-                        if processed:
-                            releases.append(processed)
-                
-                    time.sleep(1.0)  # Rate limiting
-                
                 except Exception as e:
-                    logger.warning(f"Error fetching page {page}: {e}")
-                    time.sleep(5.0)  # Backoff on error
-        
+                    logger.warning(f"Concurrent fetch failed for {label.name}, falling back to sequential: {e}")
+
+            if releases is None:
+                releases = list(self.iter_all_label_releases(label, use_response_cache=not force_update))
+
             logger.info(f"Found {len(releases)} releases for label {label.name}")
         
             # Cache the results
@@ -367,43 +412,264 @@ class DiscogsClient:
         except Exception as e:
             logger.error(f"Failed to fetch releases for {label.name}: {e}")
             return []
+
+    async def get_all_label_releases_async(self, label, concurrency=DISCOGS_CONCURRENCY, use_response_cache=True):
+        """
+        Fetch all releases for a label with concurrent page requests.
+
+        Page 1 is fetched first to read the pagination info. The remaining
+        pages are then requested together, bounded by a semaphore, with each
+        request taking its own token from the shared bucket.
+
+        Args:
+            label: Discogs label object (only ``id`` and ``name`` are used)
+            concurrency: Maximum number of in-flight page requests
+            use_response_cache: Serve and store pages through the response cache
+
+        Returns:
+            List of processed release dicts, or None when page 1 is full but
+            carries no pagination info and no page count is cached (the
+            sequential path then probes for the last page)
+        """
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is not installed")
+        if not self.user_token:
+            raise RuntimeError("Discogs client not initialized (missing token)")
+
+        semaphore = asyncio.Semaphore(max(1, min(concurrency, self.rate_limit_per_minute)))
+        headers = {
+            'Authorization': f'Discogs token={self.user_token}',
+            'User-Agent': DISCOGS_USER_AGENT,
+        }
+        timeout = aiohttp.ClientTimeout(total=DISCOGS_REQUEST_TIMEOUT)
+        connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=30)
+
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout, connector=connector) as session:
+            first_page = await self._fetch_releases_page_async(session, semaphore, label.id, 1, use_response_cache)
+            total_pages = _extract_total_pages(first_page.get('pagination'))
+
+            # If we still only have 1 page but there are clearly more items than per_page
+            if total_pages == 1 and len(first_page.get('releases') or []) >= DISCOGS_RELEASES_PER_PAGE:
+                pages_cache_key = f"discogs_label_{label.id}_pages"
+                cached_pages = self.cache_manager.load_from_cache(pages_cache_key) if self.cache_manager else None
+                if not cached_pages:
+                    logger.debug(f"No pagination info for {label.name}; deferring to sequential page probing")
+                    return None
+                total_pages = cached_pages
+                logger.debug(f"Loaded page count {total_pages} from cache")
+
+            logger.info(f"Found {total_pages} pages of releases for {label.name}")
+
+            pages = [first_page]
+            if total_pages > 1:
+                page_numbers = range(2, total_pages + 1)
+
+                results = await asyncio.gather(
+                    *(self._fetch_releases_page_async(session, semaphore, label.id, page, use_response_cache)
+                      for page in page_numbers),
+                    return_exceptions=True,
+                )
+                for page, result in zip(page_numbers, results):
+                    if isinstance(result, Exception):
+                        logger.warning(f"Error fetching page {page}: {result}")
+                        continue
+                    pages.append(result)
+
+        releases = []
+        for page_data in pages:
+            for release in page_data.get('releases', []):
+                processed = self._process_release(release)
+                if processed:
+                    releases.append(processed)
+        return releases
+
+    def _releases_page_url(self, label_id, page):
+        """Canonical URL for one page of a label's releases."""
+        return self._api_url(f'/labels/{label_id}/releases', {'page': page, 'per_page': DISCOGS_RELEASES_PER_PAGE})
+
+    async def _fetch_releases_page_async(self, session, semaphore, label_id, page, use_response_cache=True,
+                                         max_retries=DISCOGS_MAX_RETRIES):
+        """
+        Fetch one page of label releases, retrying on rate limits and transient errors.
+        """
+        url = self._releases_page_url(label_id, page)
+
+        if use_response_cache and self.response_cache:
+            cached = self.response_cache.get(url)
+            if cached is not None:
+                return cached
+
+        return await self._request_json_async(session, semaphore, url, use_response_cache, max_retries)
+
+    async def _request_json_async(self, session, semaphore, url, use_response_cache=True,
+                                  max_retries=DISCOGS_MAX_RETRIES):
+        """
+        GET a Discogs URL under the semaphore and token bucket, retrying on rate limits.
+        """
+        async with semaphore:
+            retry = 0
+            while True:
+                await self._async_rate_limit()
+                try:
+                    async with session.get(url) as resp:
+                        resp.raise_for_status()
+                        data = await resp.json()
+                    if use_response_cache and self.response_cache:
+                        self.response_cache.set(url, data)
+                    self._prev_backoff = 1.0
+                    return data
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    status = getattr(e, 'status', None)
+                    # Don't retry on 404 Not Found
+                    if status == 404:
+                        raise
+
+                    retry += 1
+                    if retry > max_retries:
+                        logger.error(f"Maximum retries reached for Discogs request {url}: {e}")
+                        raise
+
+                    if status == 429:
+                        headers = getattr(e, 'headers', None) or {}
+                        wait_time = int(headers.get('Retry-After', 60)) + DISCOGS_RETRY_AFTER_BUFFER
+                        logger.warning(f"Discogs rate limit hit. Waiting {wait_time}s (retry {retry}/{max_retries})")
+                    else:
+                        wait_time = self._next_backoff()
+                        logger.warning(f"Discogs API error: {e}. Waiting {wait_time:.1f}s (retry {retry}/{max_retries})")
+
+                    await asyncio.sleep(wait_time)
+
+    def iter_all_label_releases(self, label, use_response_cache=True):
+        """
+        Yield processed releases for a label page by page.
+
+        Only one page of releases is held in memory at a time, so callers can
+        filter or deduplicate incrementally. The combined list is not cached;
+        use get_all_label_releases for that.
+        """
+        def fetch_page(page):
+            return self._get_json(
+                f'/labels/{label.id}/releases',
+                {'page': page, 'per_page': DISCOGS_RELEASES_PER_PAGE},
+                use_response_cache=use_response_cache,
+            )
+
+        # Get first page
+        first_page = fetch_page(1)
+        first_releases = first_page.get('releases', [])
+        
+        # Extract pagination information
+        total_pages = _extract_total_pages(first_page.get('pagination'))
+
+        # If we still only have 1 page but there are clearly more items than per_page
+        if total_pages == 1 and len(first_releases) >= DISCOGS_RELEASES_PER_PAGE:
+            pages_cache_key = f"discogs_label_{label.id}_pages"
+            cached_pages = self.cache_manager.load_from_cache(pages_cache_key) if self.cache_manager else None
+            if cached_pages:
+                total_pages = cached_pages
+                logger.debug(f"Loaded page count {total_pages} from cache")
+            else:
+                total_pages = self._discover_last_page(lambda page: fetch_page(page).get('releases'))
+                logger.debug(f"Found {total_pages} pages through probing")
+                if self.cache_manager:
+                    self.cache_manager.save_to_cache(pages_cache_key, total_pages)
+    
+        logger.info(f"Found {total_pages} pages of releases for {label.name}")
+        
+        # Process first page results
+        yield from self._iter_processed(first_releases)
+    
+        # Process remaining pages
+        for page in range(2, total_pages + 1):
+            try:
+                logger.info(f"Fetching page {page}/{total_pages}...")
+                page_releases = fetch_page(page).get('releases')
+                
+                if not page_releases:
+                    logger.warning(f"No releases found on page {page}")
+                    continue
+            except Exception as e:
+                # _request_with_backoff has already retried with backoff
+                logger.warning(f"Error fetching page {page}: {e}")
+                continue
+
+            # Process releases on this page
+            yield from self._iter_processed(page_releases)
+
+    def _iter_processed(self, page_releases):
+        """Yield processed releases from one page, skipping invalid entries."""
+        for release in page_releases:
+            processed = self._process_release(release)
+            if processed:
+                yield processed
+    
+    def _discover_last_page(self, fetch_releases, max_pages=DISCOGS_SEARCH_PAGE_LIMIT):
+        """
+        Find the last non-empty page when pagination metadata is missing.
+
+        Doubles the probe page until an empty page is hit, then binary-searches
+        the boundary, so discovery costs O(log P) requests instead of O(P).
+
+        Args:
+            fetch_releases: Callable returning the release list for a page number
+            max_pages: Upper bound on the page number to probe
+        """
+        def has_page(page_number):
+            try:
+                return bool(fetch_releases(page_number))
+            except Exception as e:
+                logger.debug(f"Probe of page {page_number} failed: {e}")
+                return False
+
+        # Invariant: page lo is non-empty, page hi is empty or beyond the limit
+        lo, hi = 1, 2
+        while hi <= max_pages and has_page(hi):
+            lo, hi = hi, hi * 2
+        hi = min(hi, max_pages + 1)
+
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if has_page(mid):
+                lo = mid
+            else:
+                hi = mid
+
+        return lo
     
     def _process_release(self, release):
         """
-        Process a release object from Discogs API into a clean format.
+        Process a release dict from the Discogs API into a clean format.
         """
-        try:
-            # Basic validation
-            if not release or not hasattr(release, 'id'):
-                return None
-                
-            # Extract basic release information
-            release_data = {
-                'id': release.id,
-                'title': getattr(release, 'title', 'Unknown'),
-                'artist': getattr(release, 'artist', 'Various'),
-                'year': getattr(release, 'year', None),
-                'format': getattr(release, 'format', 'Unknown'),
-                'catno': getattr(release, 'catno', ''),
-                'resource_url': getattr(release, 'resource_url', ''),
-            }
-            return release_data
-                
-        except json.JSONDecodeError as e:
-            logger.warning(f"Error processing release {release.id}: {e}")
-            return {
-                'id': release.id,
-                'title': getattr(release, 'title', 'Unknown'),
-                'artist': getattr(release, 'artist', 'Various'),
-            }
-        except Exception as e:
-            logger.warning(f"Error processing release {release.id}: {e}")
+        if not release or 'id' not in release:
             return None
 
-def get_discogs_client(user_token=None, cache_manager=None):
+        get = release.get
+        return {
+            'id': release['id'],
+            'title': get('title', 'Unknown'),
+            'artist': get('artist', 'Various'),
+            'year': get('year'),
+            'format': get('format', 'Unknown'),
+            'catno': get('catno', ''),
+            'resource_url': get('resource_url', ''),
+        }
+
+    def close(self):
+        """Release pooled HTTP connections and the response cache."""
+        self._http.close()
+        if self.response_cache:
+            self.response_cache.close()
+
+    def __del__(self):
+        try:
+            self._http.close()
+        except Exception:
+            pass
+
+def get_discogs_client(user_token=None, cache_manager=None, limiter=None):
     """Create and initialize a Discogs client."""
     try:
-        return DiscogsClient(user_token, cache_manager)
+        return DiscogsClient(user_token, cache_manager, limiter)
     except Exception as e:
         logger.error(f"Failed to initialize Discogs client: {e}")
         raise
@@ -1,5 +1,7 @@
 import logging
 import sys
+import importlib.util
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -14,7 +16,12 @@ class Settings(BaseSettings):
     # App Settings
     log_level: str = Field("INFO", description="Logging level")
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build settings from the environment once per process."""
+    return Settings()
+
+settings = get_settings()
 
 # Import LOG_LEVEL from constants (can be overridden by config.yaml)
 try:
@@ -24,7 +31,7 @@ except ImportError:
     log_level = settings.log_level
 
 # Configure Logging
-try:
+if importlib.util.find_spec("rich") is not None:
     from rich.logging import RichHandler
     logging.basicConfig(
         level=getattr(logging, log_level.upper(), logging.INFO),
@@ -32,7 +39,7 @@ try:
         datefmt="[%X]",
         handlers=[RichHandler(rich_tracebacks=True, markup=True)]
     )
-except ImportError:
+else:
     # Fallback if rich is not installed
     logging.basicConfig(
         level=getattr(logging, log_level.upper(), logging.INFO),
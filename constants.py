@@ -6,34 +6,45 @@ Loads from config.yaml if available, otherwise uses defaults.
 """
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+@lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
     """Load configuration from config.yaml or return empty dict if not found."""
     config_path = Path(__file__).parent / "config.yaml"
     if config_path.exists():
         try:
             with open(config_path, 'r') as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=_YamlLoader) or {}
         except Exception as e:
             print(f"Warning: Could not load config.yaml: {e}")
     return {}
 
+def _flatten_config(config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested config into a dict keyed by dotted paths (sections included)."""
+    flat = {}
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(_flatten_config(value, f"{path}."))
+    return flat
+
 # Load configuration
 _config = load_config()
+_flat_config = _flatten_config(_config)
 
 # Helper function to get nested config values with defaults
 def _get_config(path: str, default: Any) -> Any:
-    """Get configuration value from nested dict using dot notation."""
-    keys = path.split('.')
-    value = _config
-    for key in keys:
-        if isinstance(value, dict) and key in value:
-            value = value[key]
-        else:
-            return default
-    return value
+    """Get configuration value using dot notation."""
+    return _flat_config.get(path, default)
 
 # Confidence Thresholds
 CONFIDENCE_THRESHOLD_AUTO_ACCEPT = _get_config('confidence.auto_accept', 70)
@@ -49,13 +60,17 @@ SIMILARITY_THRESHOLD_ALBUM_INTENT = _get_config('confidence.album_intent', 0.9)
 DISCOGS_RATE_LIMIT_PER_MINUTE = _get_config('rate_limiting.discogs.per_minute', 25)
 DISCOGS_MAX_RETRIES = _get_config('rate_limiting.discogs.max_retries', 5)
 DISCOGS_RETRY_AFTER_BUFFER = _get_config('rate_limiting.discogs.retry_after_buffer', 1.0)
+DISCOGS_CONCURRENCY = _get_config('rate_limiting.discogs.concurrency', 5)
+DISCOGS_REQUEST_TIMEOUT = _get_config('rate_limiting.discogs.request_timeout', 20)
 SPOTIFY_MIN_REQUEST_INTERVAL = _get_config('rate_limiting.spotify.min_request_interval', 0.5)
-SPOTIFY_BURST_LIMIT = _get_config('rate_limiting.spotify.burst_limit', 25)
-SPOTIFY_BURST_COOLDOWN = _get_config('rate_limiting.spotify.burst_cooldown', 1.0)
 SPOTIFY_RETRY_BACKOFF_BASE = _get_config('rate_limiting.spotify.retry_backoff_base', 1.5)
 SPOTIFY_MAX_RETRIES = _get_config('rate_limiting.spotify.max_retries', 3)
 SPOTIFY_REQUEST_TIMEOUT = _get_config('rate_limiting.spotify.request_timeout', 20)
 SPOTIFY_DEFAULT_DELAY = _get_config('rate_limiting.spotify.default_delay', 0.2)
+SPOTIFY_SEARCH_WORKERS = _get_config('rate_limiting.spotify.search_workers', 8)
+SPOTIFY_DEDUP_WORKERS = _get_config('rate_limiting.spotify.dedup_workers', 4)
+SPOTIFY_PAGE_WORKERS = _get_config('rate_limiting.spotify.page_workers', 8)
+SPOTIFY_CONCURRENT_PER_MINUTE = _get_config('rate_limiting.spotify.concurrent_per_minute', 300)
 
 # Batch Sizes
 SPOTIFY_PLAYLIST_ADD_BATCH_SIZE = _get_config('batch_sizes.spotify_playlist_add', 100)
@@ -75,7 +90,9 @@ MAX_PLAYLIST_DESCRIPTION_WIDTH = _get_config('display.max_playlist_width', 45)
 CACHE_DEFAULT_EXPIRY_DAYS = _get_config('cache.expiry_days', 7)
 CACHE_VERSION = _get_config('cache.version', "2.0")
 CACHE_TYPE = _get_config('cache.type', "json")  # "json" or "sqlite"
+CACHE_FILE_FORMAT = _get_config('cache.file_format', "json")  # "json" or "msgpack"
 CACHE_SQLITE_PATH = _get_config('cache.sqlite_path', ".cache/spotifaj.db")
+CACHE_DISCOGS_MAX_ENTRIES = _get_config('cache.discogs_max_entries', 10000)
 
 # Search and Matching
 YEAR_SEARCH_START = _get_config('search.year_start', 1950)
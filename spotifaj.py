@@ -7,12 +7,16 @@ import click
 import sys
 import os
 import re
-import time
+import heapq
+import shutil
 import base64
 import requests
-import spotipy
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
-from difflib import SequenceMatcher
 from rich.console import Console
 from rich.markup import escape
 from rich.table import Table, Column
@@ -32,10 +36,12 @@ from constants import (
     SPOTIFY_SEARCH_DEFAULT_LIMIT,
     SPOTIFY_SEARCH_RESULT_LIMIT,
     DEFAULT_DISPLAY_LIMIT,
-    SPOTIFY_DEFAULT_DELAY,
+    SPOTIFY_SEARCH_WORKERS,
+    SPOTIFY_DEDUP_WORKERS,
 )
 import spotifaj_functions
-from fuzzywuzzy import fuzz
+from utils.rate_limiter import get_rate_limiter
+from rapidfuzz import fuzz, process, utils as fuzz_utils
 
 # Import new modules
 try:
@@ -52,11 +58,49 @@ except ImportError as e:
 console = Console()
 __version__ = "0.0.3"
 
+# Strips trailing "(...)", "[...]" and "- ..." suffixes from track/album names
+_NORM_RE = re.compile(r"\s*[\(\[\-].*", re.IGNORECASE)
+
+# Extracts the playlist ID from an open.spotify.com playlist URL
+_PLAYLIST_URL_RE = re.compile(r"playlist/([a-zA-Z0-9]+)")
+# Matches a bare 22-character Spotify playlist ID
+_PLAYLIST_ID_RE = re.compile(r"^[a-zA-Z0-9]{22}\Z")
+
+# Track fields read by every export format (drops available_markets, images, etc.)
+EXPORT_ITEM_FIELDS = (
+    'next,total,items(track(name,uri,duration_ms,popularity,explicit,'
+    'artists(name),album(name,release_date),external_ids(isrc),external_urls(spotify)))'
+)
+
+# Only the playlist metadata deduplicate reads; skips the embedded first page of tracks
+DEDUP_PLAYLIST_FIELDS = 'id,name,owner.id,collaborative,tracks.total'
+
+# Title block at the top of CHANGELOG.md; kept once when new entries are prepended
+TITLE_PREAMBLE = "# Changelog\n\nAll notable changes to this project will be documented in this file.\n\n"
+TITLE_PREAMBLE_LEN = len(TITLE_PREAMBLE)
+
+# Keep-alive session for non-API downloads (cover images); retries transient failures
+_HTTP = requests.Session()
+_HTTP.mount('https://', HTTPAdapter(
+    pool_connections=10, pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+))
+
+def _fmt_link(text, target, _esc=escape):
+    """Format text as a Rich hyperlink (plain escaped text if there is no target)."""
+    return f"[link={target}]{_esc(text)}[/link]" if target else _esc(text)
+
+def _fmt_dur(ms):
+    """Format a duration in milliseconds as M:SS."""
+    return f"{ms // 60000}:{ms // 1000 % 60:02d}"
+
 @click.group()
 @click.version_option(__version__)
-def spotifaj():
+@click.option('--no-client-cache', is_flag=True, help="Create a fresh Spotify client for every call (for debugging auth issues).")
+def spotifaj(no_client_cache):
     """Spotify CLI tool."""
-    pass
+    if no_client_cache:
+        spotifaj_functions.CLIENT_CACHE_ENABLED = False
 
 @spotifaj.command()
 @click.argument('label')
@@ -70,7 +114,9 @@ def spotifaj():
 def search_label(label, username, playlist, exhaustive, year, validate, min_confidence, no_verify):
     """Search for tracks by label and optionally add to a playlist."""
     
-    if year and str(year).lower() == 'all':
+    # Normalize the year option once; 'all' is an alias for --exhaustive
+    year = str(year).strip().lower() if year else None
+    if year == 'all':
         exhaustive = True
         year = None
 
@@ -84,24 +130,43 @@ def search_label(label, username, playlist, exhaustive, year, validate, min_conf
         sys.exit(1)
 
     if year:
-        if '-' in str(year):
+        if '-' in year:
             try:
                 start_str, end_str = year.split('-')
                 start_year = int(start_str)
                 end_year = int(end_str)
                 
                 logger.info("Searching for label: '%s' in range %d-%d...", label, start_year, end_year)
-                found_tracks = []
-                seen_ids = set()
-                
-                for y in range(start_year, end_year + 1):
-                    print(f"Scanning year {y}...", end='\r')
-                    tracks = spotifaj_functions.search_tracks_by_year(sp, label, y)
-                    for track in tracks:
-                        if track['id'] not in seen_ids:
-                            seen_ids.add(track['id'])
-                            found_tracks.append(track)
-                print() # Clear progress line
+                found_by_id = {}
+                years = range(start_year, end_year + 1)
+
+                def search_year(y):
+                    # Each worker thread uses its own client
+                    year_sp = spotifaj_functions.get_thread_spotify_client(username) or sp
+                    return spotifaj_functions.search_tracks_by_year(year_sp, label, y)
+
+                # Years are independent network round-trips, so scan them concurrently
+                tracks_by_year = {}
+                with Progress(
+                    TextColumn("[cyan]Scanning years[/cyan]"),
+                    BarColumn(),
+                    TaskProgressColumn(),
+                    TimeRemainingColumn(),
+                    console=console,
+                    transient=True
+                ) as progress:
+                    task = progress.add_task("years", total=len(years))
+                    with ThreadPoolExecutor(max_workers=SPOTIFY_SEARCH_WORKERS) as executor:
+                        futures = {executor.submit(search_year, y): y for y in years}
+                        for future in as_completed(futures):
+                            tracks_by_year[futures[future]] = future.result()
+                            progress.advance(task)
+
+                # Merge in year order so results are deterministic
+                for y in years:
+                    for track in tracks_by_year[y]:
+                        found_by_id.setdefault(track['id'], track)
+                found_tracks = list(found_by_id.values())
             except ValueError:
                 logger.error(f"Invalid year range: {year}. Use format YYYY-YYYY.")
                 sys.exit(1)
@@ -114,20 +179,40 @@ def search_label(label, username, playlist, exhaustive, year, validate, min_conf
                 logger.error(f"Invalid year: {year}. Use a 4-digit year, range YYYY-YYYY, or 'all'.")
                 sys.exit(1)
     elif exhaustive:
-        found_tracks = spotifaj_functions.search_tracks_exhaustive(sp, label)
+        found_tracks = spotifaj_functions.search_tracks_exhaustive(sp, label, username=username)
     else:
         logger.info("Searching for label: '%s' (Standard Search)...", label)
         query = f"label:\"{label}\""
-        found_tracks = []
+        found_by_id = {}
+        pages = []
         try:
             results = sp.search(q=query, limit=50, type='track', market='US')
             if results:
-                found_tracks.extend(results['tracks']['items'])
-                while results['tracks']['next']:
-                    results = sp.next(results['tracks'])
-                    found_tracks.extend(results['tracks']['items'])
+                # The first page reports the total, so the remaining offsets
+                # (search stops at 1000) can be fetched concurrently
+                total = min(results['tracks']['total'], 1000)
+                offsets = range(50, total, 50)
+
+                limiter = get_rate_limiter()
+
+                def search_page(offset):
+                    page_sp = spotifaj_functions.get_thread_spotify_client(username) or sp
+                    limiter.wait('spotify_concurrent')
+                    return spotifaj_functions._spotify_call(
+                        lambda: page_sp.search(q=query, limit=50, offset=offset, type='track', market='US')
+                    )
+
+                pages.append(results)
+                with ThreadPoolExecutor(max_workers=SPOTIFY_SEARCH_WORKERS) as executor:
+                    # map yields pages in offset order; pages that still failed after retries are skipped
+                    pages.extend(page for page in executor.map(search_page, offsets) if page)
         except Exception as e:
             logger.error(f"Error during search: {e}")
+        for page in pages:
+            # Dedup by ID (dict keeps first-seen order)
+            for track in page['tracks']['items']:
+                found_by_id.setdefault(track['id'], track)
+        found_tracks = list(found_by_id.values())
 
     total_tracks = len(found_tracks)
     logger.info(f"Total tracks found: {total_tracks}")
@@ -209,22 +294,21 @@ def search_label(label, username, playlist, exhaustive, year, validate, min_conf
         if is_existing:
             logger.info("Checking for duplicates (ID & Metadata)...")
             
-            # 1. ID Check (Fast)
             existing_ids = spotifaj_functions.get_playlist_track_ids(username, target_playlist_id)
-            found_tracks = [t for t in found_tracks if t['id'] not in existing_ids]
             
-            # 2. Metadata Check (Slower but catches cross-album duplicates)
-            if found_tracks:
+            # ID check (fast) first; only fetch signatures if it leaves anything to compare
+            candidates = [t for t in found_tracks if t['id'] not in existing_ids]
+            if candidates:
                 existing_signatures = spotifaj_functions.get_playlist_track_signatures(username, target_playlist_id)
-                unique_tracks = []
-                for t in found_tracks:
-                    sig = spotifaj_functions.create_track_signature(t)
-                    if sig not in existing_signatures:
-                        unique_tracks.append(t)
-                        # Add to signatures to prevent duplicates within the new batch itself
-                        existing_signatures.add(sig) 
                 
-                found_tracks = unique_tracks
+                # Metadata check (catches cross-album duplicates). The set grows as we go to
+                # prevent duplicates within the new batch itself (same ID implies same signature).
+                seen = existing_signatures
+                add_sig = seen.add
+                signatures = spotifaj_functions.create_track_signatures(candidates)
+                found_tracks = [t for t, sig in zip(candidates, signatures) if sig not in seen and not add_sig(sig)]
+            else:
+                found_tracks = []
 
             track_ids = [t['id'] for t in found_tracks]
             
@@ -388,82 +472,80 @@ def search(query, type):
             return
             
         # Sort by similarity to query, then popularity
+        q_norm = query.casefold().strip()
         if type in ['track', 'artist', 'album']:
-             def sort_key(item):
-                 name = item['name']
-                 # Calculate similarity
-                 similarity = SequenceMatcher(None, query.lower().strip(), name.lower().strip()).ratio()
+             # Score every name against the query in one RapidFuzz call (limit=None keeps all)
+             matches = process.extract(
+                 query, [item['name'] for item in items],
+                 scorer=fuzz.ratio, processor=fuzz_utils.default_process, limit=None
+             )
+             similarity = {index: score for _, score, index in matches}
+
+             def sort_key(index):
                  # Return tuple: (similarity, popularity)
                  # This ensures exact/close matches come first, and among those, the most popular ones.
-                 return (similarity, item.get('popularity', 0))
+                 return (similarity[index], items[index].get('popularity', 0))
              
-             items.sort(key=sort_key, reverse=True)
+             # Only the top 20 unique items are shown; keep a small buffer for dedup instead of a full sort
+             items = [items[i] for i in heapq.nlargest(30, range(len(items)), key=sort_key)]
 
         # If artist search, prioritize exact matches and reduce noise
         if type == 'artist':
-            exact_matches = [item for item in items if item['name'].lower().strip() == query.lower().strip()]
+            exact_matches = [item for item in items if item['name'].casefold().strip() == q_norm]
             if exact_matches:
                 items = exact_matches
             else:
                 # If no exact match, limit to top 5 to avoid long list of bad matches
                 items = items[:5]
 
+        def media_key(it):
+            # Use primary artist only for deduplication
+            artists = it.get('artists')
+            # Normalize name: remove (...) and [...] and - ...
+            return f"{_NORM_RE.sub('', it['name'])}:{artists[0]['name'] if artists else ''}"
+
+        def media_text(it):
+            return f"{it['name']} - {', '.join(a['name'] for a in it.get('artists') or [])}"
+
+        # Pick the dedup key and display text builders once for this result type
+        key_fn, text_fn = {
+            'track': (media_key, media_text),
+            'album': (media_key, media_text),
+            'artist': (lambda it: it['name'], lambda it: it['name']),
+            'playlist': (
+                lambda it: f"{it['name']}:{it['owner']['display_name']}",
+                lambda it: f"{it['name']} (by {it['owner']['display_name']})",
+            ),
+        }.get(type, (lambda it: it['id'], lambda it: None))
+
         seen = set()
-        unique_items = []
+        unique_items = []  # (display text, url) pairs
         
         for item in items:
-            name = item['name']
-            # Create a unique key for deduplication based on display attributes
-            if type == 'track':
-                # Use primary artist only for deduplication
-                primary_artist = item['artists'][0]['name']
-                # Normalize name: remove (...) and [...] and - ...
-                norm_name = re.sub(r"(?i)\s*(\(|\[|-).*", "", name)
-                key = f"{norm_name}:{primary_artist}"
-            elif type == 'artist':
-                key = name
-            elif type == 'album':
-                primary_artist = item['artists'][0]['name']
-                norm_name = re.sub(r"(?i)\s*(\(|\[|-).*", "", name)
-                key = f"{norm_name}:{primary_artist}"
-            elif type == 'playlist':
-                owner = item['owner']['display_name']
-                key = f"{name}:{owner}"
-            else:
-                key = item['id']
-            
-            # Normalize key for case-insensitive comparison
-            key = key.lower().strip()
-            
-            if key not in seen:
-                seen.add(key)
-                unique_items.append(item)
+            # Unique key based on display attributes, normalized for case-insensitive comparison
+            key = key_fn(item).casefold().strip()
             
-            if len(unique_items) >= 20:
-                break
+            if key in seen:
+                continue
+            seen.add(key)
 
-        for i, item in enumerate(unique_items):
-            name = item['name']
+            text = text_fn(item)
             # Use Spotify URI (spotify:...) to open directly in app
-            url = item.get('uri') or item.get('external_urls', {}).get('spotify', '')
+            url = item.get('uri') or (item.get('external_urls') or {}).get('spotify', '')
+            unique_items.append((text, url))
             
-            def fmt_link(text, target):
-                return f"[link={target}]{escape(text)}[/link]" if target else escape(text)
+            if len(unique_items) >= 20:
+                break
 
+        # Render all rows in one console.print so Rich parses markup and writes once
+        lines = []
+        for i, (text, url) in enumerate(unique_items):
+            if text is None:
+                continue
             prefix = f"{i+1:>2}. " if len(unique_items) > 1 else ""
-
-            # Handle different item types for display
-            if type == 'track':
-                artists = ", ".join([a['name'] for a in item['artists']])
-                console.print(f"{prefix}{fmt_link(f'{name} - {artists}', url)}", highlight=False)
-            elif type == 'artist':
-                console.print(f"{prefix}{fmt_link(name, url)}", highlight=False)
-            elif type == 'album':
-                artists = ", ".join([a['name'] for a in item['artists']])
-                console.print(f"{prefix}{fmt_link(f'{name} - {artists}', url)}", highlight=False)
-            elif type == 'playlist':
-                owner = item['owner']['display_name']
-                console.print(f"{prefix}{fmt_link(f'{name} (by {owner})', url)}", highlight=False)
+            lines.append(f"{prefix}{_fmt_link(text, url)}")
+        if lines:
+            console.print("\n".join(lines), highlight=False)
                 
     except Exception as e:
         logger.error(f"Error during search: {e}")
@@ -478,25 +560,16 @@ def list_playlists(username):
         sys.exit(1)
         
     try:
-        all_playlists = []
-        playlists = sp.user_playlists(username)
-        while playlists:
-            all_playlists.extend(playlists['items'])
-            if playlists['next']:
-                playlists = sp.next(playlists)
-            else:
-                break
-        
-        # Display in numbered format like search command
-        from rich.markup import escape
-        for i, playlist in enumerate(all_playlists, 1):
-            name = playlist['name']
-            uri = playlist.get('uri', '')
-            
-            def fmt_link(text, target):
-                return f"[link={target}]{escape(text)}[/link]" if target else escape(text)
-            
-            console.print(f"{i:>2}. {fmt_link(name, uri)}", highlight=False)
+        # Print each page while the next one is being fetched
+        i = 0
+        for page in spotifaj_functions.iter_pages_prefetched(sp, sp.user_playlists(username)):
+            # Display in numbered format like search command, one write per page
+            lines = []
+            for playlist in page['items']:
+                i += 1
+                lines.append(f"{i:>2}. {_fmt_link(playlist['name'], playlist.get('uri', ''))}")
+            if lines:
+                console.print("\n".join(lines), highlight=False)
             
     except Exception as e:
         logger.error(f"Error fetching playlists: {e}")
@@ -570,40 +643,43 @@ def search_and_add(query, username, playlist, artist, album, track, limit, fetch
             best_type = 'track'
             best_score = 0.0
             best_match_name = query
-            
-            # Check Artist
-            if intent_results.get('artists', {}).get('items'):
-                artist_obj = intent_results['artists']['items'][0]
-                score = SequenceMatcher(None, query.lower(), artist_obj['name'].lower()).ratio()
-                # Boost artist score slightly as it's a common intent for "Name" queries
-                if score > SIMILARITY_THRESHOLD_ARTIST_INTENT: 
-                    best_score = score
-                    best_type = 'artist'
-                    best_match_name = artist_obj['name']
-            
-            # Check Album (only override artist if significantly better)
-            if intent_results.get('albums', {}).get('items'):
-                album_obj = intent_results['albums']['items'][0]
-                score = SequenceMatcher(None, query.lower(), album_obj['name'].lower()).ratio()
-                if score > best_score and score > SIMILARITY_THRESHOLD_ALBUM_INTENT:
+            # Normalize the query once; each candidate is normalized as it's scored
+            q_proc = fuzz_utils.default_process(query)
+
+            def intent_score(candidate, cutoff):
+                candidate = fuzz_utils.default_process(candidate)
+                # Exact match: no need for the fuzzy scorer
+                if candidate == q_proc:
+                    return 1.0
+                # Scores below cutoff can't be selected; RapidFuzz bails out early and returns 0
+                return fuzz.ratio(q_proc, candidate, score_cutoff=cutoff * 100) / 100.0
+            
+            # Artist first: it's the common intent for "Name" queries, so an album only
+            # overrides it if strictly better. An exact artist match can't be beaten.
+            # Track is never auto-selected: "Thriller" is both, and Artist or Album is a
+            # better playlist source than a single track; general search covers it.
+            intent_thresholds = {
+                'artist': SIMILARITY_THRESHOLD_ARTIST_INTENT,
+                'album': SIMILARITY_THRESHOLD_ALBUM_INTENT,
+            }
+            for intent_type, threshold in intent_thresholds.items():
+                if best_score == 1.0:
+                    break
+                candidates = (intent_results.get(f'{intent_type}s') or {}).get('items')
+                if not candidates:
+                    continue
+                candidate_name = candidates[0]['name']
+                score = intent_score(candidate_name, max(best_score, threshold))
+                if score > best_score and score > threshold:
                     best_score = score
-                    best_type = 'album'
-                    best_match_name = album_obj['name']
-            
-            # Check Track (only override if exact match or very high confidence and others are low)
-            if intent_results.get('tracks', {}).get('items'):
-                track_obj = intent_results['tracks']['items'][0]
-                score = SequenceMatcher(None, query.lower(), track_obj['name'].lower()).ratio()
-                # If track is exact match, it might be a track search, but "Thriller" is both.
-                # Usually if user wants a playlist, Artist or Album is better source than single track.
-                # So we only default to track if Artist/Album scores are low.
-                pass 
-
-            if best_type == 'artist' and best_score > SIMILARITY_THRESHOLD_ARTIST_INTENT:
+                    best_type = intent_type
+                    best_match_name = candidate_name
+
+            if best_type == 'artist':
                 logger.info(f"Detected Artist intent: '{best_match_name}' (Confidence: {best_score:.2f})")
                 # Use original query to avoid incorrect auto-correction (e.g. Igor Jadranin -> Igor Garanin)
                 search_query = f"artist:{query}"
-            elif best_type == 'album' and best_score > SIMILARITY_THRESHOLD_ALBUM_INTENT:
+            elif best_type == 'album':
                 logger.info(f"Detected Album intent: '{best_match_name}' (Confidence: {best_score:.2f})")
                 search_query = f"album:{query}"
             else:
@@ -632,19 +708,15 @@ def search_and_add(query, username, playlist, artist, album, track, limit, fetch
     # User requirement: "per default if no option provided - display only first DEFAULT_DISPLAY_LIMIT"
     display_limit = DEFAULT_DISPLAY_LIMIT
     
-    for i, track in enumerate(tracks):
-        if i >= display_limit:
-            break
-            
+    lines = []
+    for i, track in enumerate(tracks[:display_limit]):
         name = track['name']
-        artists = ", ".join([a['name'] for a in track['artists']])
+        artists = ", ".join(a['name'] for a in track['artists'])
         # Use Spotify URI (spotify:...) to open directly in app
-        url = track.get('uri') or track.get('external_urls', {}).get('spotify', '')
+        url = track.get('uri') or (track.get('external_urls') or {}).get('spotify', '')
         
-        def fmt_link(text, target):
-            return f"[link={target}]{escape(text)}[/link]" if target else escape(text)
-            
-        console.print(f"{i+1:>2}. {fmt_link(f'{name} - {artists}', url)}", highlight=False)
+        lines.append(f"{i+1:>2}. {_fmt_link(f'{name} - {artists}', url)}")
+    console.print("\n".join(lines), highlight=False)
 
     if total_tracks > display_limit:
         console.print(f"... and {total_tracks - display_limit} more tracks (not displayed).")
@@ -695,32 +767,29 @@ def deduplicate(playlist_input, username, check_all, dry_run, keep_best):
 
     if check_all:
         logger.info("Fetching all user playlists...")
-        all_playlists = spotifaj_functions.fetch_all_user_playlists(username)
-        # Filter to only owned playlists
-        playlists_to_check = [p for p in all_playlists if p['owner']['id'] == username]
-        logger.info(f"Filtered to {len(playlists_to_check)} owned playlists (out of {len(all_playlists)} total).")
+        # Stream owned playlists page by page so scanning starts while later pages are still loading
+        playlists_to_check = (p for p in spotifaj_functions.iter_all_user_playlists(username) if p['owner']['id'] == username)
     elif playlist_input:
         # Check if input is a URL
-        url_match = re.search(r"playlist/([a-zA-Z0-9]+)", playlist_input)
+        url_match = _PLAYLIST_URL_RE.search(playlist_input)
         if url_match:
             playlist_id = url_match.group(1)
             try:
-                pl = sp.playlist(playlist_id)
+                pl = sp.playlist(playlist_id, fields=DEDUP_PLAYLIST_FIELDS)
                 playlists_to_check = [pl]
             except Exception as e:
                 logger.error(f"Could not find playlist with ID {playlist_id}: {e}")
                 return
         else:
-            # Treat as name
-            playlist_id = spotifaj_functions.find_playlist_by_name(username, playlist_input)
-            if playlist_id:
-                pl = sp.playlist(playlist_id)
+            # Treat as name; the playlist object from the name scan already has the fields we need
+            pl = spotifaj_functions.find_playlist_by_name(username, playlist_input, return_full=True)
+            if pl:
                 playlists_to_check = [pl]
             else:
                 logger.error(f"Could not find playlist named '{playlist_input}'.")
                 return
 
-    if not playlists_to_check:
+    if not check_all and not playlists_to_check:
         logger.info("No playlists found to check.")
         return
 
@@ -729,9 +798,15 @@ def deduplicate(playlist_input, username, check_all, dry_run, keep_best):
     max_duplicates = 0
     max_dup_playlist = None
     playlists_with_dups = 0
-    total_playlists = len(playlists_to_check)
 
-    console.print(f"[bold cyan]Checking {total_playlists} playlists for duplicates...[/bold cyan]")
+    if check_all:
+        console.print("[bold cyan]Checking owned playlists for duplicates...[/bold cyan]")
+    else:
+        console.print(f"[bold cyan]Checking {len(playlists_to_check)} playlists for duplicates...[/bold cyan]")
+
+    def scan_playlist(pl):
+        # Each page request inside waits on the shared Spotify bucket
+        return spotifaj_functions.find_duplicates_in_playlist(username, pl['id'])
 
     with Progress(
         TimeElapsedColumn(),
@@ -743,14 +818,25 @@ def deduplicate(playlist_input, username, check_all, dry_run, keep_best):
         TimeRemainingColumn(),
         console=console,
         transient=False
-    ) as progress:
-        task = progress.add_task("...", total=total_playlists)
+    ) as progress, ThreadPoolExecutor(max_workers=SPOTIFY_DEDUP_WORKERS) as executor:
+        task = progress.add_task("...", total=None)
+
+        # Scans run concurrently and start as soon as each page of playlists arrives;
+        # results (and any prompts) are handled here on the main thread
+        futures = {}
+        for pl in playlists_to_check:
+            futures[executor.submit(scan_playlist, pl)] = pl
+            progress.update(task, total=len(futures))
+        total_playlists = len(futures)
+
+        if not futures:
+            logger.info("No playlists found to check.")
+            return
+        if check_all:
+            logger.info(f"Found {total_playlists} owned playlists.")
 
-        for pl_index, pl in enumerate(playlists_to_check):
-            # Be polite to the API - increase delay to avoid rate limiting
-            # Use longer delay when processing many playlists
-            time.sleep(0.5 if total_playlists > 50 else SPOTIFY_DEFAULT_DELAY)
-            
+        for pl_index, future in enumerate(as_completed(futures)):
+            pl = futures[future]
             name = pl['name']
             pid = pl['id']
             owner_id = pl['owner']['id']
@@ -762,11 +848,13 @@ def deduplicate(playlist_input, username, check_all, dry_run, keep_best):
             progress.update(task, description=f"[cyan]'{name}'...[/cyan]")
             
             try:
-                duplicates = spotifaj_functions.find_duplicates_in_playlist(username, pid)
+                duplicates = future.result()
             except Exception as e:
                 if '429' in str(e):
                     console.print(f"\n[yellow]⚠ Rate limit reached. Processed {pl_index + 1}/{total_playlists} playlists.[/yellow]")
                     console.print(f"[yellow]Please wait before running again, or process fewer playlists at a time.[/yellow]")
+                    for pending in futures:
+                        pending.cancel()
                     break
                 else:
                     console.print(f"\n[red]Error processing '{name}': {e}[/red]")
@@ -776,7 +864,6 @@ def deduplicate(playlist_input, username, check_all, dry_run, keep_best):
             if duplicates and keep_best:
                 # Apply keep-best logic to determine which versions to keep
                 # Group duplicates by signature
-                from collections import defaultdict
                 dup_groups = defaultdict(list)
                 
                 for d in duplicates:
@@ -858,34 +945,36 @@ def deduplicate(playlist_input, username, check_all, dry_run, keep_best):
                 table.add_column("Duration", justify="right")
                 table.add_column("Match Type", style="red")
 
+                add_row = table.add_row
                 for d in duplicates:
                     dup = d['duplicate']
                     orig = d['original']
-                    pos = d['position']
-                    
-                    # Format duration
-                    dur_ms = dup['duration_ms']
-                    minutes, seconds = divmod(dur_ms // 1000, 60)
-                    duration_str = f"{minutes}:{seconds:02d}"
+                    dup_name = dup['name']
+                    dup_artist = dup['artists'][0]['name']
+                    dup_album = dup['album']['name']
                     
-                    table.add_row(
-                        str(pos + 1), # 1-based index for display
-                        dup['name'],
-                        dup['artists'][0]['name'],
-                        dup['album']['name'],
-                        duration_str,
+                    add_row(
+                        str(d['position'] + 1), # 1-based index for display
+                        dup_name,
+                        dup_artist,
+                        dup_album,
+                        _fmt_dur(dup['duration_ms']),
                         "Duplicate"
                     )
-                    # Optionally show the original it matched against?
+                    # Show the original it matched against, unless it would repeat the row above
                     if dup['uri'] != orig['uri']:
-                         table.add_row(
-                            "", 
-                            f"↳ Matches: {orig['name']}", 
-                            orig['artists'][0]['name'], 
-                            orig['album']['name'], 
-                            "", 
-                            "Original"
-                        )
+                        orig_name = orig['name']
+                        orig_artist = orig['artists'][0]['name']
+                        orig_album = orig['album']['name']
+                        if (orig_name, orig_artist, orig_album) != (dup_name, dup_artist, dup_album):
+                            add_row(
+                                "",
+                                f"↳ Matches: {orig_name}",
+                                orig_artist,
+                                orig_album,
+                                "",
+                                "Original"
+                            )
 
                 progress.console.print(table)
                 
@@ -897,13 +986,9 @@ def deduplicate(playlist_input, username, check_all, dry_run, keep_best):
                     progress.stop() # Pause progress for input
                     if spotifaj_functions.confirm(f"Remove {len(duplicates)} duplicates from '{name}'?", default=False):
                         # Group by URI for removal
-                        removal_map = {} # uri -> list of positions
+                        removal_map = defaultdict(list) # uri -> list of positions
                         for d in duplicates:
-                            uri = d['duplicate']['uri']
-                            pos = d['position']
-                            if uri not in removal_map:
-                                removal_map[uri] = []
-                            removal_map[uri].append(pos)
+                            removal_map[d['duplicate']['uri']].append(d['position'])
                         
                         tracks_to_remove = [{'uri': uri, 'positions': positions} for uri, positions in removal_map.items()]
                         
@@ -915,7 +1000,7 @@ def deduplicate(playlist_input, username, check_all, dry_run, keep_best):
                             console=console,
                             transient=True
                         ) as remove_progress:
-                            remove_task = remove_progress.add_task("Removing...", total=len(tracks_to_remove))
+                            remove_task = remove_progress.add_task("Removing...", total=len(duplicates))
                             
                             def update_progress(count):
                                 remove_progress.advance(remove_task, count)
@@ -968,10 +1053,10 @@ def export_playlist(playlist_input, username, format, file):
     playlist_id = None
 
     # 1. Try to parse as URL or ID
-    match = re.search(r'playlist/([a-zA-Z0-9]+)', playlist_input)
+    match = _PLAYLIST_URL_RE.search(playlist_input)
     if match:
         playlist_id = match.group(1)
-    elif re.match(r'^[a-zA-Z0-9]{22}$', playlist_input):
+    elif _PLAYLIST_ID_RE.match(playlist_input):
         playlist_id = playlist_input
     
     # 2. If not URL/ID, try to find by name
@@ -987,15 +1072,10 @@ def export_playlist(playlist_input, username, format, file):
     
     try:
         # Get playlist info
-        playlist_info = sp.playlist(playlist_id)
+        playlist_info = sp.playlist(playlist_id, fields='name')
         playlist_name = playlist_info['name']
         
-        results = sp.playlist_items(playlist_id)
-        tracks = results['items']
-        
-        while results['next']:
-            results = sp.next(results)
-            tracks.extend(results['items'])
+        tracks = spotifaj_functions.fetch_playlist_items(sp, playlist_id, fields=EXPORT_ITEM_FIELDS)
         
         # Filter out None tracks
         valid_tracks = []
@@ -1014,7 +1094,7 @@ def export_playlist(playlist_input, username, format, file):
             lines = []
             for item in valid_tracks:
                 track = item['track']
-                artists = ", ".join([a['name'] for a in track['artists']])
+                artists = ", ".join(a['name'] for a in track['artists'])
                 lines.append(f"{artists} - {track['name']}")
                 # Include URI as comment only when exporting to file (for reliable re-import)
                 if file:
@@ -1028,7 +1108,7 @@ def export_playlist(playlist_input, username, format, file):
             
             for item in valid_tracks:
                 track = item['track']
-                artists = ", ".join([a['name'] for a in track['artists']])
+                artists = ", ".join(a['name'] for a in track['artists'])
                 album = track['album']['name']
                 year = track['album'].get('release_date', '')[:4] if track['album'].get('release_date') else ''
                 duration = track['duration_ms']
@@ -1070,7 +1150,7 @@ def export_playlist(playlist_input, username, format, file):
             lines = ['#EXTM3U']
             for item in valid_tracks:
                 track = item['track']
-                artists = ", ".join([a['name'] for a in track['artists']])
+                artists = ", ".join(a['name'] for a in track['artists'])
                 duration_sec = track['duration_ms'] // 1000
                 lines.append(f"#EXTINF:{duration_sec},{artists} - {track['name']}")
                 lines.append(track['external_urls'].get('spotify', track['uri']))
@@ -1082,7 +1162,9 @@ def export_playlist(playlist_input, username, format, file):
                 f.write(output_content)
             console.print(f"[green]Exported {len(valid_tracks)} tracks to {file}[/green]")
         else:
-            print(output_content)
+            # Output is already one joined string; write it in one call
+            sys.stdout.write(output_content)
+            sys.stdout.write("\n")
             
     except Exception as e:
         logger.error(f"Error exporting playlist: {e}")
@@ -1108,11 +1190,14 @@ def upload_playlist_cover(sp, playlist_id, image_url):
     try:
         # Download image
         logger.info(f"Downloading image from {image_url}...")
-        response = requests.get(image_url, timeout=10)
-        response.raise_for_status()
-        
-        # Open image with PIL
-        img = Image.open(BytesIO(response.content))
+        with _HTTP.get(image_url, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            
+            # Open image with PIL straight from the (decompressed) response stream,
+            # loading it before the connection is released
+            response.raw.decode_content = True
+            img = Image.open(response.raw)
+            img.load()
         
         # Convert to RGB if needed (for PNG with transparency, etc.)
         if img.mode != 'RGB':
@@ -1126,57 +1211,64 @@ def upload_playlist_cover(sp, playlist_id, image_url):
         # Start with reasonable dimensions and aggressive compression
         max_dimension = 640  # Spotify shows at 300x300, so 640 is safe
         
-        # Resize if too large
+        # Resize if too large (in place, aspect preserved; reducing_gap does a fast
+        # box reduce first so large originals don't need a full LANCZOS pass)
         if width > max_dimension or height > max_dimension:
-            if width > height:
-                new_width = max_dimension
-                new_height = int(height * (max_dimension / width))
-            else:
-                new_height = max_dimension
-                new_width = int(width * (max_dimension / height))
-            
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            logger.debug(f"Resized to: {new_width}x{new_height}")
+            img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS, reducing_gap=3.0)
+            logger.debug(f"Resized to: {img.width}x{img.height}")
         
         # Compress to fit under 256KB (accounting for base64 encoding overhead)
         # Base64 adds exactly 4/3 overhead (33.33%), so aim for max 180KB raw data to be safe
         MAX_RAW_SIZE = 180 * 1024  # 180KB raw = 240KB encoded (safe margin under 256KB)
         
-        quality = 90
-        buffer = BytesIO()
-        img.save(buffer, format='JPEG', quality=quality, optimize=True)
-        image_data = buffer.getvalue()
-        
-        logger.debug(f"Initial compression at quality {quality}: {len(image_data)} bytes")
-        
-        # Reduce quality until it fits
-        while len(image_data) > MAX_RAW_SIZE and quality > 30:
-            quality -= 5
+        def encode(q):
+            # Returns the buffer and its size; size is the write position, no bytes copy needed
+            # Progressive scans compress better with optimized Huffman tables; above 95
+            # libjpeg drops its rate-distortion tuning, so quality is capped there
             buffer = BytesIO()
-            img.save(buffer, format='JPEG', quality=quality, optimize=True)
-            image_data = buffer.getvalue()
-            logger.debug(f"Compressed to quality {quality}: {len(image_data)} bytes")
+            img.save(buffer, format='JPEG', quality=min(q, 95), optimize=True, progressive=True)
+            return buffer, buffer.tell()
+        
+        quality = 90
+        image_buffer, image_size = encode(quality)
+        
+        logger.debug(f"Initial compression at quality {quality}: {image_size} bytes")
+        
+        # Binary search for the highest quality (down to 30) that fits; size shrinks with quality.
+        # If nothing fits, keep the quality 30 encoding for the dimension fallback below.
+        if image_size > MAX_RAW_SIZE:
+            lo, hi = 30, quality - 1
+            fitted = False
+            while lo <= hi:
+                mid = (lo + hi) // 2
+                buffer, size = encode(mid)
+                logger.debug(f"Compressed to quality {mid}: {size} bytes")
+                if size <= MAX_RAW_SIZE:
+                    quality, image_buffer, image_size, fitted = mid, buffer, size, True
+                    lo = mid + 1
+                else:
+                    if not fitted:
+                        quality, image_buffer, image_size = mid, buffer, size
+                    hi = mid - 1
         
         # If still too large, reduce dimensions further
         current_width, current_height = img.size
-        while len(image_data) > MAX_RAW_SIZE and current_width > 300:
+        while image_size > MAX_RAW_SIZE and current_width > 300:
             # Reduce by 10% each iteration
             current_width = int(current_width * 0.9)
             current_height = int(current_height * 0.9)
             
-            img = img.resize((current_width, current_height), Image.Resampling.LANCZOS)
-            buffer = BytesIO()
-            img.save(buffer, format='JPEG', quality=quality, optimize=True)
-            image_data = buffer.getvalue()
-            logger.debug(f"Resized to {current_width}x{current_height}, {len(image_data)} bytes")
+            img.thumbnail((current_width, current_height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+            image_buffer, image_size = encode(quality)
+            logger.debug(f"Resized to {current_width}x{current_height}, {image_size} bytes")
         
-        if len(image_data) > MAX_RAW_SIZE:
-            raise Exception(f"Image too large even after compression ({len(image_data)} bytes raw, ~{int(len(image_data) * 1.33)} bytes encoded, max 256KB encoded)")
+        if image_size > MAX_RAW_SIZE:
+            raise Exception(f"Image too large even after compression ({image_size} bytes raw, ~{int(image_size * 1.33)} bytes encoded, max 256KB encoded)")
         
-        logger.info(f"Final image: {len(image_data)} bytes (quality={quality}, size={img.size})")
+        logger.info(f"Final image: {image_size} bytes (quality={quality}, size={img.size})")
         
-        # Encode to base64
-        encoded_image = base64.b64encode(image_data).decode('utf-8')
+        # Encode to base64 straight from the buffer's memory (no intermediate bytes copy)
+        encoded_image = base64.b64encode(image_buffer.getbuffer()).decode('ascii')
         
         # Upload to Spotify
         sp.playlist_upload_cover_image(playlist_id, encoded_image)
@@ -1187,6 +1279,38 @@ def upload_playlist_cover(sp, playlist_id, image_url):
         raise Exception(f"Failed to process/upload image: {e}")
 
 
+# Patterns used by the track matching helpers below, compiled once
+_VS_RE = re.compile(r'\s+vs\.?\s+|\s+v\.?\s+', re.IGNORECASE)
+# Dashes, slashes, pipes and commas -> space (single-character swaps, so no regex needed)
+_SEPARATOR_TABLE = str.maketrans(dict.fromkeys('-–—―‐‑‒−/|,', ' '))
+_NUMBER_PREFIX_RE = re.compile(r'^\s*\d+\.\s*')
+_QUOTED_TRACK_RE = re.compile(r'^([^"]+?)\s+"([^"]+)"\s*(?:\([^)]+\))?')
+_METADATA_PAREN_RES = [
+    re.compile(r'\s*\(taken from[^)]+\)', re.IGNORECASE),
+    re.compile(r'\s*\(from[^)]+\d{4}[^)]*\)', re.IGNORECASE),  # (from Album, 2004)
+    re.compile(r'\s*\(released (?:on|in)[^)]+\)', re.IGNORECASE),  # (released on 12'' By BBE in 2003)
+]
+_FEATURING_RES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (r'\s+featuring\s+', r'\s+feat\.?\s+', r'\s+ft\.?\s+', r'\s+with\s+', r'\s+&\s+')
+]
+# Splits on featuring/feat/ft/with/& and also on commas (with optional spaces)
+_ARTIST_SPLIT_RE = re.compile(r'\s+(?:featuring|feat\.?|ft\.?|with|&)\s+|\s*,\s*', re.IGNORECASE)
+# Version suffixes (Radio Edit, Remix, Remaster, ...) cut from the first match to the end;
+# a year before "Remaster" is kept, as it always has been
+_SUFFIX_STRIP_RE = re.compile(
+    r'\s*(?:radio\s+edit|single\s+edit|album\s+version|original\s+mix|remaster|remix).*$',
+    re.IGNORECASE,
+)
+# Trailing "minus" then "plus" version indicators, checked after the suffixes are gone
+_VERSION_TAIL_RE = re.compile(r'(?:\s+plus)?(?:\s+minus)?$', re.IGNORECASE)
+_REMIX_EDIT_RE = re.compile(r'\b(remix|mix|edit)\b', re.IGNORECASE)
+_REMIX_RE = re.compile(r'\b(remix|mix)\b', re.IGNORECASE)
+_RADIO_EDIT_RE = re.compile(r'\b(radio|single|original)\s+(edit|mix|version)\b', re.IGNORECASE)
+_VERSION_INFO_RE = re.compile(r'\b(version|edit|mix|live|acoustic|instrumental)\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=8192)
 def normalize_text_for_matching(text):
     """
     Normalize text for fuzzy matching.
@@ -1211,11 +1335,11 @@ def normalize_text_for_matching(text):
     
     # Normalize all dash types, separators, and "vs"/"v" to space
     # This makes "theorem vs. swayzak" match "theorem, swayzak"
-    text = re.sub(r'\s+vs\.?\s+|\s+v\.?\s+', ' ', text, flags=re.IGNORECASE)  # "vs." or "v." -> space
-    text = re.sub(r'[-–—―‐‑‒−/|,]', ' ', text)  # dashes, slashes, commas -> space
+    text = _VS_RE.sub(' ', text)  # "vs." or "v." -> space
+    text = text.translate(_SEPARATOR_TABLE)  # dashes, slashes, commas -> space
     
     # Collapse multiple spaces to single space
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = ' '.join(text.split())
     
     return text.lower()
 
@@ -1235,7 +1359,7 @@ def parse_track_input(line):
         tuple: (artist, track_name, all_artists) where all_artists is the full artist string
     """
     # Strip numbered prefixes like "01. ", "1. ", etc.
-    line = re.sub(r'^\s*\d+\.\s*', '', line)
+    line = _NUMBER_PREFIX_RE.sub('', line)
     
     # Don't normalize yet - we need separators to parse!
     # Just clean up the pipe content first
@@ -1243,7 +1367,7 @@ def parse_track_input(line):
         line = line.split('|')[0].strip()
     
     # Check for format: Artist "Track Name" (Label)
-    quoted_match = re.match(r'^([^"]+?)\s+"([^"]+)"\s*(?:\([^)]+\))?', line)
+    quoted_match = _QUOTED_TRACK_RE.match(line)
     if quoted_match:
         artist_part = quoted_match.group(1).strip()
         track = quoted_match.group(2).strip()
@@ -1253,9 +1377,8 @@ def parse_track_input(line):
     # Remove common metadata patterns in parentheses
     # Examples: (taken from Album, Year), (Album Version), (feat. Artist), etc.
     # Keep version info like (Remix), (Radio Edit) as those are important for matching
-    line = re.sub(r'\s*\(taken from[^)]+\)', '', line, flags=re.IGNORECASE)
-    line = re.sub(r'\s*\(from[^)]+\d{4}[^)]*\)', '', line, flags=re.IGNORECASE)  # (from Album, 2004)
-    line = re.sub(r'\s*\(released (?:on|in)[^)]+\)', '', line, flags=re.IGNORECASE)  # (released on 12'' By BBE in 2003)
+    for pattern in _METADATA_PAREN_RES:
+        line = pattern.sub('', line)
     
     # Common separators (including all dash types)
     separators = [' - ', ' – ', ' — ', ': ']
@@ -1286,19 +1409,10 @@ def normalize_artist_string(artist_str):
     Returns:
         tuple: (primary_artist, normalized_all_artists)
     """
-    # Patterns for featuring
-    featuring_patterns = [
-        r'\s+featuring\s+',
-        r'\s+feat\.?\s+',
-        r'\s+ft\.?\s+',
-        r'\s+with\s+',
-        r'\s+&\s+',
-    ]
-    
     # Extract primary artist (before any featuring pattern)
     primary_artist = artist_str
-    for pattern in featuring_patterns:
-        match = re.split(pattern, artist_str, maxsplit=1, flags=re.IGNORECASE)
+    for pattern in _FEATURING_RES:
+        match = pattern.split(artist_str, maxsplit=1)
         if len(match) > 1:
             primary_artist = match[0].strip()
             break
@@ -1307,6 +1421,15 @@ def normalize_artist_string(artist_str):
     return primary_artist, artist_str
 
 
+@lru_cache(maxsize=8192)
+def strip_track_suffixes(track):
+    """
+    Remove version suffixes from a track name for better matching.
+    (Radio Edit, Remix, Remaster, etc. shouldn't reduce confidence)
+    """
+    return _VERSION_TAIL_RE.sub('', _SUFFIX_STRIP_RE.sub('', track)).strip()
+
+
 def calculate_match_confidence(search_result, expected_artist, expected_track, expected_all_artists=None):
     """
     Calculate confidence score for a search result match.
@@ -1335,71 +1458,49 @@ def calculate_match_confidence(search_result, expected_artist, expected_track, e
     actual_track_norm = normalize_text_for_matching(actual_track).lower()
     
     # Remove common suffixes from track names for better matching
-    # (Radio Edit, Remix, Remaster, etc. shouldn't reduce confidence)
-    def strip_track_suffixes(track):
-        suffixes = [
-            r'\s*radio\s+edit.*$',
-            r'\s*single\s+edit.*$',
-            r'\s*album\s+version.*$',
-            r'\s*original\s+mix.*$',
-            r'\s*remaster.*$',
-            r'\s*remix.*$',
-            r'\s*\d{4}\s+remaster.*$',
-            r'\s+minus$',  # Trailing "minus" (version indicator)
-            r'\s+plus$',   # Trailing "plus" (version indicator)
-        ]
-        for suffix in suffixes:
-            track = re.sub(suffix, '', track, flags=re.IGNORECASE)
-        return track.strip()
-    
     expected_track_clean = strip_track_suffixes(expected_track_norm)
     actual_track_clean = strip_track_suffixes(actual_track_norm)
     
     # Track name matching (50 points max)
     if expected_track:
-        track_similarity = SequenceMatcher(None, expected_track_clean, actual_track_clean).ratio()
+        track_similarity = fuzz.ratio(expected_track_clean, actual_track_clean) / 100.0
         confidence += int(track_similarity * 50)
         
         # Bonus for original/radio versions over remixes
         # If the expected track doesn't mention a remix, prefer original versions
-        if not re.search(r'\b(remix|mix|edit)\b', expected_track, re.IGNORECASE):
+        if not _REMIX_EDIT_RE.search(expected_track):
             # Check if actual track is a remix (but not radio/single edit)
-            if re.search(r'\b(remix|mix)\b', actual_track, re.IGNORECASE):
+            if _REMIX_RE.search(actual_track):
                 # Don't penalize Radio Edit or Single Edit
-                if not re.search(r'\b(radio|single|original)\s+(edit|mix|version)\b', actual_track, re.IGNORECASE):
+                if not _RADIO_EDIT_RE.search(actual_track):
                     # Heavy penalize other remixes by 20 points
                     confidence = max(0, confidence - 20)
             # Boost Radio Edit / Original Mix / Single Edit by 10 points
-            elif re.search(r'\b(radio|single|original)\s+(edit|mix|version)\b', actual_track, re.IGNORECASE):
+            elif _RADIO_EDIT_RE.search(actual_track):
                 confidence = min(100, confidence + 10)
             # Also boost if it's just the plain track (no version info)
-            elif not re.search(r'\b(version|edit|mix|live|acoustic|instrumental)\b', actual_track, re.IGNORECASE):
+            elif not _VERSION_INFO_RE.search(actual_track):
                 confidence = min(100, confidence + 5)
     
     # Artist matching (50 points max)
     if expected_artist:
         # Normalize expected artist
         expected_artist_norm = normalize_text_for_matching(expected_artist).lower()
-        # Check against all artists in the track
-        artist_scores = []
+        # Check against all artists in the track (normalized once, reused for every expected name)
+        actual_artists_norm = [normalize_text_for_matching(a).lower() for a in actual_artists]
+        ratio = fuzz.ratio
         
         # 1. Check primary artist match (with normalization)
-        for actual_artist in actual_artists:
-            actual_artist_norm = normalize_text_for_matching(actual_artist).lower()
-            score = SequenceMatcher(None, expected_artist_norm, actual_artist_norm).ratio()
-            artist_scores.append(score)
+        artist_scores = [ratio(expected_artist_norm, a) / 100.0 for a in actual_artists_norm]
         
         # 2. Also check if any words from expected_all_artists appear in actual artists
         if expected_all_artists:
             # Extract artist names from the full string
             # Split on featuring/feat/ft/with/& and also on commas (with optional spaces)
-            expected_names = re.split(r'\s+(?:featuring|feat\.?|ft\.?|with|&)\s+|\s*,\s*', expected_all_artists, flags=re.IGNORECASE)
+            expected_names = _ARTIST_SPLIT_RE.split(expected_all_artists)
             for expected_name in expected_names:
                 expected_name_norm = normalize_text_for_matching(expected_name.strip()).lower()
-                for actual_artist in actual_artists:
-                    actual_artist_norm = normalize_text_for_matching(actual_artist).lower()
-                    score = SequenceMatcher(None, expected_name_norm, actual_artist_norm).ratio()
-                    artist_scores.append(score)
+                artist_scores.extend(ratio(expected_name_norm, a) / 100.0 for a in actual_artists_norm)
             
             # Bonus: If we have multiple expected artists, check if actual track also has multiple
             # and if the artist count is similar (indicates multi-artist collaboration match)
@@ -1492,7 +1593,7 @@ def import_playlist(input_file, name, username, yes, url):
     Reads from INPUT_FILE, stdin, or --url if provided.
     Expected format: "Artist - Track Name" per line.
     """
-    # Handle input source
+    # Handle input source (files and stdin are streamed, not read into a list)
     if url:
         # Check if it's a 1001tracklists URL
         if '1001tracklists.com' in url:
@@ -1504,227 +1605,270 @@ def import_playlist(input_file, name, username, yes, url):
             logger.error("URL must be from 1001tracklists.com")
             return
     elif input_file:
-        lines = input_file.readlines()
+        lines = input_file
     else:
         # Check if data is being piped
-        if not sys.stdin.isatty():
-            lines = sys.stdin.readlines()
-        else:
+        if sys.stdin.isatty():
             console.print("[yellow]Enter tracks (Artist - Song Name), one per line.[/yellow]")
             console.print("[yellow]Press Ctrl+D (Linux/Mac) or Ctrl+Z (Windows) on a new line to finish:[/yellow]")
-            lines = sys.stdin.readlines()
+        lines = sys.stdin
+
+    # Normalize search terms by removing special characters for better matching
+    def normalize_for_search(text):
+        if not text:
+            return ""
+        # Remove apostrophes (Yesterday's -> Yesterdays)
+        text = text.replace("'", "").replace("'", "")
+        # Remove dashes, pipes, and other separators
+        text = re.sub(r'[-–—|/]', ' ', text)
+        # Collapse multiple spaces
+        text = re.sub(r'\s+', ' ', text).strip()
+        return text
+    
+    # Add fuzzy search variant for common typos
+    def create_fuzzy_variants(text):
+        """Create search variants for common typos."""
+        variants = [text]
+        
+        # Common misspellings: y <-> i (Rythym vs Rhythm)
+        if 'y' in text.lower():
+            variants.append(re.sub(r'y', 'i', text, flags=re.IGNORECASE))
+        if 'i' in text.lower():
+            variants.append(re.sub(r'i', 'y', text, flags=re.IGNORECASE))
+        
+        return list(set(variants))  # Remove duplicates
+
+    track_uris = []
+    not_found = []
+    low_confidence_matches = []
+    search_jobs = []  # Lines that need a Spotify search, in input order
+
+    def add_search_job(line_num, line):
+        try:
+            # Parse the input to extract artist and track
+            artist, track, all_artists = parse_track_input(line)
+            
+            # Try multiple search strategies for better results
+            search_queries = []
+            
+            if artist and track:
+                # Normalize both artist and track for search
+                artist_norm = normalize_for_search(artist)
+                track_norm = normalize_for_search(track)
+                
+                # Strategy 1: Simple artist + track (flexible, works for most cases)
+                search_queries.append(f"{artist_norm} {track_norm}")
+                
+                # Strategy 2: Add fuzzy variants for track name to catch typos
+                track_variants = create_fuzzy_variants(track_norm)
+                for variant in track_variants:
+                    if variant != track_norm:  # Don't duplicate the original
+                        search_queries.append(f"{artist_norm} {variant}")
+                
+                # Strategy 3: Track name only (fallback for rare/misspelled artists)
+                search_queries.append(f"{track_norm}")
+            else:
+                # Fallback: search the whole line (normalized)
+                search_queries.append(normalize_for_search(track or line))
+            
+            search_jobs.append((line_num, line, artist, track, all_artists, search_queries))
+        except Exception as e:
+            logger.error(f"Error searching for '{line}': {e}")
+            not_found.append(line)
+    
+    # Pass 1: resolve direct URIs and build search queries for everything else.
+    # A track line is held back one line to see whether a URI comment (from our
+    # TXT export) follows it.
+    pending = None  # (line_num, line)
+    line_count = 0
+    for line_num, raw_line in enumerate(lines):
+        line_count += 1
+        line = raw_line.strip()
+        
+        if pending is not None:
+            pending_num, pending_line = pending
+            pending = None
+            if line.startswith("# spotify:track:"):
+                # Use the URI directly without searching
+                uri = line[2:].strip()  # Remove "# " prefix
+                track_uris.append({
+                    'uri': uri,
+                    'input': pending_line,
+                    'found': f'{pending_line} (from URI)',
+                    'confidence': 100,
+                    'line_num': pending_num
+                })
+                continue
+            add_search_job(pending_num, pending_line)
+        
+        if not line:
+            continue
+        
+        # Skip log lines if piping from export command
+        # (one tuple startswith keeps the "INFO" scan off ordinary track lines)
+        if line.startswith(("[", "Exporting playlist")) and (line[0] != "[" or "INFO" in line):
+            continue
+        
+        # Check if this is a direct URI input (without comment prefix)
+        if line.startswith("spotify:track:"):
+            track_uris.append({
+                'uri': line,
+                'input': line,
+                'found': f'{line} (direct URI)',
+                'confidence': 100,
+                'line_num': line_num
+            })
+            continue
+        
+        # Skip URI comment lines - they should have been processed with their track line
+        if line.startswith("# spotify:track:"):
+            continue
+        
+        pending = (line_num, line)
+    
+    if pending is not None:
+        add_search_job(*pending)
 
-    if not lines:
+    if not line_count:
         logger.warning("No input provided.")
         return
 
+    logger.info(f"Processed {line_count} lines ({len(search_jobs)} to search)...")
+
     sp = spotifaj_functions.get_spotify_client(username=username)
     if not sp:
         logger.error("Failed to initialize Spotify client.")
         sys.exit(1)
 
-    # Helper function to handle API calls with automatic token refresh
-    def safe_search(query, limit=50, max_retries=3):
-        """Perform a search with automatic token refresh on 401 errors."""
-        for attempt in range(max_retries):
-            try:
-                return sp.search(q=query, limit=limit, type='track')
-            except spotipy.exceptions.SpotifyException as e:
-                if e.http_status == 401 and attempt < max_retries - 1:
-                    # Token expired - the auth_manager should auto-refresh on next call
-                    logger.warning(f"Token expired during search, retrying... (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(1)
-                    continue
-                else:
-                    raise
-            except Exception as e:
-                raise
-        return None
-
-    track_uris = []
-    not_found = []
-    low_confidence_matches = []
-    
-    logger.info(f"Processing {len(lines)} lines...")
-    
+    def best_candidate(search_queries, artist, track, all_artists):
+        """Pick the highest-confidence track across all search strategies."""
+        # Collect results from all search strategies
+        all_items = []
+        seen_uris = set()
+        
+        for search_query in search_queries:
+            # Deduplicate by URI
+            for item in search_results.get(search_query, ()):
+                if item['uri'] not in seen_uris:
+                    all_items.append(item)
+                    seen_uris.add(item['uri'])
+        
+        # Exact prescreen: identical normalized artist and track always scores 100,
+        # so skip fuzzy scoring entirely when a candidate matches byte-for-byte
+        if artist and track:
+            norm = normalize_text_for_matching
+            artist_norm = norm(artist)
+            track_norm = norm(track)
+            for item in all_items:
+                if norm(item['name']) == track_norm and any(norm(a['name']) == artist_norm for a in item['artists']):
+                    return item, 100
+        
+        # Calculate confidence for each result
+        best_match = None
+        best_confidence = 0
+        # Confidence depends only on the track name and artist names, so the same
+        # recording on another album/compilation scores the same; score it once
+        # (ties keep the earlier candidate anyway)
+        scored = set()
+        
+        for item in all_items:
+            scoring_key = (item['name'], tuple(a['name'] for a in item['artists']))
+            if scoring_key in scored:
+                continue
+            scored.add(scoring_key)
+            confidence = calculate_match_confidence(item, artist, track, all_artists)
+            if confidence > best_confidence:
+                best_confidence = confidence
+                best_match = item
+            
+            # Debug: log all candidates with confidence > 30% for manual review
+            if confidence >= 30:
+                logger.debug(f"Candidate: {', '.join([a['name'] for a in item['artists']])} - {item['name']} ({confidence}%)")
+        
+        return best_match, best_confidence
+
+    # Minimum threshold: don't suggest garbage matches
+    MIN_SUGGESTION_CONFIDENCE = 40
+
+    # Pass 2: run searches concurrently (network-bound, so overlap the round-trips).
+    # Repeated lines (and overlapping strategies) share a query, so search each only once.
+    # Each line's primary query (artist + track) runs first; lines whose best primary
+    # result is already auto-accepted skip their fuzzy-variant and track-only fallbacks.
+    best_by_line = {}  # line -> (best_match, best_confidence); repeated lines reuse the first result
     with Progress(
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TaskProgressColumn(),
         console=console
     ) as progress:
-        task = progress.add_task("Searching tracks...", total=len(lines))
-        
-        line_num = 0
-        while line_num < len(lines):
-            line = lines[line_num].strip()
-            
-            if not line:
-                progress.advance(task)
-                line_num += 1
-                continue
-            
-            # Skip log lines if piping from export command
-            if (line.startswith("[") and "INFO" in line) or line.startswith("Exporting playlist"):
-                progress.advance(task)
-                line_num += 1
-                continue
-            
-            # Check if this is a direct URI input (without comment prefix)
-            if line.startswith("spotify:track:"):
-                uri = line.strip()
-                track_uris.append({
-                    'uri': uri,
-                    'input': uri,
-                    'found': f'{uri} (direct URI)',
-                    'confidence': 100,
-                    'line_num': line_num
-                })
-                progress.advance(task)
-                line_num += 1
-                continue
-            
-            # Skip URI comment lines - they should have been processed with their track line
-            if line.startswith("# spotify:track:"):
-                progress.advance(task)
-                line_num += 1
+        primary_queries = list(dict.fromkeys(job[5][0] for job in search_jobs))
+        task = progress.add_task("Searching tracks...", total=len(primary_queries))
+        # Completions arrive in bursts; advance the bar in batches rather than per query
+        pending_advance = 0
+
+        def advance(_query):
+            nonlocal pending_advance
+            pending_advance += 1
+            if pending_advance >= 16:
+                flush_advance()
+
+        def flush_advance():
+            nonlocal pending_advance
+            if pending_advance:
+                progress.advance(task, pending_advance)
+                pending_advance = 0
+
+        # Increase limit to 50 to catch more variations/remixes
+        search_results = spotifaj_functions.search_tracks_many(sp, primary_queries, limit=50, on_done=advance, username=username)
+        flush_advance()
+
+        for line_num, line, artist, track, all_artists, search_queries in search_jobs:
+            if len(search_queries) < 2 or line in best_by_line:
                 continue
-            
-            # Check if next line is a URI comment (from our TXT export)
-            has_uri_next = (line_num + 1 < len(lines) and 
-                           lines[line_num + 1].strip().startswith("# spotify:track:"))
-            
-            if has_uri_next:
-                # Use the URI directly without searching
-                uri = lines[line_num + 1].strip()[2:].strip()  # Remove "# " prefix
-                track_uris.append({
-                    'uri': uri,
-                    'input': line,
-                    'found': f'{line} (from URI)',
-                    'confidence': 100,
-                    'line_num': line_num
-                })
-                progress.advance(task)
-                progress.advance(task)  # Skip the URI line too
-                line_num += 2  # Skip both lines
-                continue
-
             try:
-                # Parse the input to extract artist and track
-                artist, track, all_artists = parse_track_input(line)
-                
-                # Normalize search terms by removing special characters for better matching
-                def normalize_for_search(text):
-                    if not text:
-                        return ""
-                    # Remove apostrophes (Yesterday's -> Yesterdays)
-                    text = text.replace("'", "").replace("'", "")
-                    # Remove dashes, pipes, and other separators
-                    text = re.sub(r'[-–—|/]', ' ', text)
-                    # Collapse multiple spaces
-                    text = re.sub(r'\s+', ' ', text).strip()
-                    return text
-                
-                # Add fuzzy search variant for common typos
-                def create_fuzzy_variants(text):
-                    """Create search variants for common typos."""
-                    variants = [text]
-                    
-                    # Common misspellings: y <-> i (Rythym vs Rhythm)
-                    if 'y' in text.lower():
-                        variants.append(re.sub(r'y', 'i', text, flags=re.IGNORECASE))
-                    if 'i' in text.lower():
-                        variants.append(re.sub(r'i', 'y', text, flags=re.IGNORECASE))
-                    
-                    return list(set(variants))  # Remove duplicates
-                
-                # Try multiple search strategies for better results
-                search_queries = []
-                
-                if artist and track:
-                    # Normalize both artist and track for search
-                    artist_norm = normalize_for_search(artist)
-                    track_norm = normalize_for_search(track)
-                    
-                    # Strategy 1: Simple artist + track (flexible, works for most cases)
-                    search_queries.append(f"{artist_norm} {track_norm}")
-                    
-                    # Strategy 2: Add fuzzy variants for track name to catch typos
-                    track_variants = create_fuzzy_variants(track_norm)
-                    for variant in track_variants:
-                        if variant != track_norm:  # Don't duplicate the original
-                            search_queries.append(f"{artist_norm} {variant}")
-                    
-                    # Strategy 3: Track name only (fallback for rare/misspelled artists)
-                    search_queries.append(f"{track_norm}")
-                else:
-                    # Fallback: search the whole line (normalized)
-                    search_queries.append(normalize_for_search(track or line))
-                
-                # Collect results from all search strategies
-                all_items = []
-                seen_uris = set()
-                
-                for search_query in search_queries:
-                    try:
-                        # Increase limit to 50 to catch more variations/remixes
-                        # Use safe_search to handle token expiration
-                        results = safe_search(search_query, limit=50)
-                        if results:
-                            items = results['tracks']['items']
-                            # Deduplicate by URI
-                            for item in items:
-                                if item['uri'] not in seen_uris:
-                                    all_items.append(item)
-                                    seen_uris.add(item['uri'])
-                    except Exception as search_err:
-                        logger.debug(f"Search query '{search_query}' failed: {search_err}")
-                        continue
+                best = best_candidate(search_queries[:1], artist, track, all_artists)
+            except Exception:
+                continue  # Scored again (and reported) in pass 3
+            if best[0] and best[1] >= CONFIDENCE_THRESHOLD_AUTO_ACCEPT:
+                best_by_line[line] = best
+
+        fallback_queries = list(dict.fromkeys(
+            q for job in search_jobs if job[1] not in best_by_line
+            for q in job[5][1:] if q not in search_results
+        ))
+        if fallback_queries:
+            progress.update(task, total=len(primary_queries) + len(fallback_queries))
+            search_results.update(spotifaj_functions.search_tracks_many(sp, fallback_queries, limit=50, on_done=advance, username=username))
+            flush_advance()
+
+    # Pass 3: score candidates for each line (repeated lines reuse the first result)
+    for line_num, line, artist, track, all_artists, search_queries in search_jobs:
+        try:
+            if line not in best_by_line:
+                best_by_line[line] = best_candidate(search_queries, artist, track, all_artists)
+            best_match, best_confidence = best_by_line[line]
+            
+            # Accept match based on confidence
+            if best_match and best_confidence >= MIN_SUGGESTION_CONFIDENCE:
+                track_info = {
+                    'uri': best_match['uri'],
+                    'input': line,
+                    'found': f"{', '.join([a['name'] for a in best_match['artists']])} - {best_match['name']}",
+                    'confidence': best_confidence,
+                    'line_num': line_num  # Preserve original order
+                }
                 
-                if all_items:
-                    # Calculate confidence for each result
-                    best_match = None
-                    best_confidence = 0
-                    
-                    for item in all_items:
-                        confidence = calculate_match_confidence(item, artist, track, all_artists)
-                        if confidence > best_confidence:
-                            best_confidence = confidence
-                            best_match = item
-                        
-                        # Debug: log all candidates with confidence > 30% for manual review
-                        if confidence >= 30:
-                            logger.debug(f"Candidate: {', '.join([a['name'] for a in item['artists']])} - {item['name']} ({confidence}%)")
-                    
-                    # Accept match based on confidence
-                    # Minimum threshold: don't suggest garbage matches
-                    MIN_SUGGESTION_CONFIDENCE = 40
-                    
-                    if best_match and best_confidence >= MIN_SUGGESTION_CONFIDENCE:
-                        track_info = {
-                            'uri': best_match['uri'],
-                            'input': line,
-                            'found': f"{', '.join([a['name'] for a in best_match['artists']])} - {best_match['name']}",
-                            'confidence': best_confidence,
-                            'line_num': line_num  # Preserve original order
-                        }
-                        
-                        if best_confidence >= CONFIDENCE_THRESHOLD_AUTO_ACCEPT:
-                            track_uris.append(track_info)
-                        else:
-                            # Low confidence - save for manual review
-                            low_confidence_matches.append(track_info)
-                    else:
-                        # No match above minimum threshold
-                        not_found.append(line)
+                if best_confidence >= CONFIDENCE_THRESHOLD_AUTO_ACCEPT:
+                    track_uris.append(track_info)
                 else:
-                    not_found.append(line)
-            except Exception as e:
-                logger.error(f"Error searching for '{line}': {e}")
+                    # Low confidence - save for manual review
+                    low_confidence_matches.append(track_info)
+            else:
+                # No match above minimum threshold
                 not_found.append(line)
-            
-            progress.advance(task)
-            line_num += 1
+        except Exception as e:
+            logger.error(f"Error searching for '{line}': {e}")
+            not_found.append(line)
 
     # Report results
     console.print(f"\n[bold]Found {len(track_uris)} high-confidence matches.[/bold]")
@@ -1791,10 +1935,10 @@ def analytics(playlist_input, username):
 
     # Parse playlist input
     playlist_id = None
-    match = re.search(r'playlist/([a-zA-Z0-9]+)', playlist_input)
+    match = _PLAYLIST_URL_RE.search(playlist_input)
     if match:
         playlist_id = match.group(1)
-    elif re.match(r'^[a-zA-Z0-9]{22}$', playlist_input):
+    elif _PLAYLIST_ID_RE.match(playlist_input):
         playlist_id = playlist_input
     
     if not playlist_id:
@@ -2290,12 +2434,16 @@ def _auto_update_single(sp, tracker, label, username, playlist_name, playlist_id
             if new_tracks:
                 existing_signatures = spotifaj_functions.get_playlist_track_signatures(username, playlist_id)
                 unique_tracks = []
+                append = unique_tracks.append
+                add_sig = existing_signatures.add
+                create_sig = spotifaj_functions.create_track_signature
                 for t in new_tracks:
-                    sig = spotifaj_functions.create_track_signature(t)
-                    if sig not in existing_signatures:
-                        unique_tracks.append(t)
-                        # Add to signatures to prevent duplicates within the new batch itself
-                        existing_signatures.add(sig)
+                    sig = create_sig(t)
+                    if sig in existing_signatures:
+                        continue
+                    # Add to signatures to prevent duplicates within the new batch itself
+                    add_sig(sig)
+                    append(t)
                 
                 metadata_dupes = len(new_tracks) - len(unique_tracks)
                 new_tracks = unique_tracks
@@ -2386,10 +2534,10 @@ def recommend(playlist_input, username, limit, target_name):
 
     # Parse playlist input
     playlist_id = None
-    match = re.search(r'playlist/([a-zA-Z0-9]+)', playlist_input)
+    match = _PLAYLIST_URL_RE.search(playlist_input)
     if match:
         playlist_id = match.group(1)
-    elif re.match(r'^[a-zA-Z0-9]{22}$', playlist_input):
+    elif _PLAYLIST_ID_RE.match(playlist_input):
         playlist_id = playlist_input
     
     if not playlist_id:
@@ -2621,18 +2769,21 @@ def install_completion(shell):
         rc_file = Path.home() / '.config/fish/completions/spotifaj.fish'
         cmd = f'eval ({env_var}=fish_source {script_path})'
         
-    console.print(f"Detected script path: [cyan]{script_path}[/cyan]")
+    # Collect the instructions and render them in a single console.print
+    msg = [f"Detected script path: [cyan]{script_path}[/cyan]"]
     
     if shell in ['bash', 'zsh']:
-        console.print(f"To enable completion, run this command (or add it to {rc_file}):")
-        console.print(f"\n    [green]{cmd}[/green]\n")
+        msg.append(f"To enable completion, run this command (or add it to {rc_file}):")
+        msg.append(f"\n    [green]{cmd}[/green]\n")
         
         # Add wrapper hint
         wrapper_path = os.path.join(os.path.dirname(script_path), 'spotifaj')
         if os.path.exists(wrapper_path):
-             console.print("[yellow]Note: Since you are using the './spotifaj' wrapper, use this instead to fix the command name:[/yellow]")
+             msg.append("[yellow]Note: Since you are using the './spotifaj' wrapper, use this instead to fix the command name:[/yellow]")
              wrapper_cmd = f'_SPOTIFAJ_PY_COMPLETE=zsh_source "{wrapper_path}" | sed "s/spotifaj\\.py/spotifaj/g" > ~/.spotifaj-complete.zsh && source ~/.spotifaj-complete.zsh'
-             console.print(f"    [green]{wrapper_cmd}[/green]\n")
+             msg.append(f"    [green]{wrapper_cmd}[/green]\n")
+
+        console.print("\n".join(msg))
 
         if click.confirm(f"Append this to {rc_file}?"):
             try:
@@ -2642,7 +2793,8 @@ def install_completion(shell):
             except Exception as e:
                 console.print(f"[red]Failed to write to {rc_file}: {e}[/red]")
     else:
-        console.print(f"For fish, run:\n    {cmd}")
+        msg.append(f"For fish, run:\n    {cmd}")
+        console.print("\n".join(msg))
 
 @spotifaj.command()
 @click.argument('source_playlist')
@@ -2678,10 +2830,10 @@ def sync_playlist(source_playlist, target_playlist, username, remove_extra, pres
     
     # Resolve source playlist ID
     source_id = None
-    match = re.search(r'playlist/([a-zA-Z0-9]+)', source_playlist)
+    match = _PLAYLIST_URL_RE.search(source_playlist)
     if match:
         source_id = match.group(1)
-    elif re.match(r'^[a-zA-Z0-9]{22}$', source_playlist):
+    elif _PLAYLIST_ID_RE.match(source_playlist):
         source_id = source_playlist
     else:
         # Try exact match first, then fuzzy match
@@ -2697,10 +2849,10 @@ def sync_playlist(source_playlist, target_playlist, username, remove_extra, pres
     
     # Resolve target playlist ID
     target_id = None
-    match = re.search(r'playlist/([a-zA-Z0-9]+)', target_playlist)
+    match = _PLAYLIST_URL_RE.search(target_playlist)
     if match:
         target_id = match.group(1)
-    elif re.match(r'^[a-zA-Z0-9]{22}$', target_playlist):
+    elif _PLAYLIST_ID_RE.match(target_playlist):
         target_id = target_playlist
     else:
         # Try exact match first, then fuzzy match
@@ -2857,10 +3009,10 @@ def merge_playlists(source_playlist, target_playlist, username, keep_best, dry_r
     
     # Resolve source playlist ID
     source_id = None
-    match = re.search(r'playlist/([a-zA-Z0-9]+)', source_playlist)
+    match = _PLAYLIST_URL_RE.search(source_playlist)
     if match:
         source_id = match.group(1)
-    elif re.match(r'^[a-zA-Z0-9]{22}$', source_playlist):
+    elif _PLAYLIST_ID_RE.match(source_playlist):
         source_id = source_playlist
     else:
         # Try exact match first, then fuzzy match
@@ -2884,10 +3036,10 @@ def merge_playlists(source_playlist, target_playlist, username, keep_best, dry_r
     
     # Resolve target playlist ID
     target_id = None
-    match = re.search(r'playlist/([a-zA-Z0-9]+)', target_playlist)
+    match = _PLAYLIST_URL_RE.search(target_playlist)
     if match:
         target_id = match.group(1)
-    elif re.match(r'^[a-zA-Z0-9]{22}$', target_playlist):
+    elif _PLAYLIST_ID_RE.match(target_playlist):
         target_id = target_playlist
     else:
         # Try exact match first, then fuzzy match
@@ -3030,7 +3182,7 @@ def generate_changelog(version, dry_run):
             parts = [int(x) for x in current.split('.')]
             parts[-1] += 1
             version = ".".join(map(str, parts))
-        except:
+        except (ValueError, AttributeError):
             pass
 
     logger.info(f"Generating changelog for version {version}...")
@@ -3043,22 +3195,27 @@ def generate_changelog(version, dry_run):
         else:
             changelog_path = "CHANGELOG.md"
             
-            # Read existing content
-            existing = ""
-            if os.path.exists(changelog_path):
-                with open(changelog_path, 'r') as f:
-                    existing = f.read()
+            # Write new content to a temp file and swap it in, so a crash never leaves a truncated changelog
+            tmp_path = changelog_path + ".tmp"
+            try:
+                with open(tmp_path, 'w', buffering=1 << 20) as f:
+                    # Title, new entry and separator in a single write
+                    f.write(f"{TITLE_PREAMBLE}{content}\n\n")
                     
-                # Remove title if present to avoid duplication when prepending
-                if existing.startswith("# Changelog"):
-                    existing = existing.replace("# Changelog\n\nAll notable changes to this project will be documented in this file.\n\n", "")
-            
-            # Write new content
-            with open(changelog_path, 'w') as f:
-                f.write("# Changelog\n\nAll notable changes to this project will be documented in this file.\n\n")
-                f.write(content)
-                f.write("\n\n")
-                f.write(existing)
+                    # Stream the existing entries after the new ones
+                    if os.path.exists(changelog_path):
+                        with open(changelog_path, 'r') as old:
+                            # Peek only at the title to avoid duplicating it when prepending
+                            head = old.read(TITLE_PREAMBLE_LEN)
+                            if head != TITLE_PREAMBLE:
+                                f.write(head)
+                            shutil.copyfileobj(old, f, 1 << 20)
+                os.replace(tmp_path, changelog_path)
+            except BaseException:
+                # Don't leave a half-written temp file in the working tree
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
                 
             console.print(f"[bold green]Updated {changelog_path}[/bold green]")
             
@@ -2,13 +2,21 @@
 Helper functions for Spotify interactions.
 """
 
+import asyncio
 import datetime
+from collections import defaultdict
+import queue
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List, Dict, Any, Callable, Set, Tuple
+import requests
 import spotipy
 import spotipy.util as util
+from requests.adapters import HTTPAdapter
 from spotipy.oauth2 import SpotifyClientCredentials, SpotifyOAuth
 from config import settings, logger
+from utils.rate_limiter import get_rate_limiter
 from constants import (
     SPOTIFY_MAX_RETRIES,
     SPOTIFY_RETRY_BACKOFF_BASE,
@@ -19,6 +27,8 @@ from constants import (
     YEAR_SEARCH_START,
     YEAR_SEARCH_END,
     DURATION_BUCKET_SIZE_MS,
+    SPOTIFY_SEARCH_WORKERS,
+    SPOTIFY_PAGE_WORKERS,
 )
 
 # Import advanced deduplication logic
@@ -30,10 +40,21 @@ except ImportError:
 try:
     from rich.console import Console
     from rich.table import Table
+    from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
     console = Console()
 except ImportError:
     console = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 # Default scope for user operations
 DEFAULT_SCOPE = (
     "user-read-private "
@@ -49,6 +70,38 @@ DEFAULT_SCOPE = (
 
 COUNTRY = DEFAULT_COUNTRY_CODE
 
+SPOTIFY_API_BASE = 'https://api.spotify.com/v1'
+
+_thread_local = threading.local()
+
+def _http_session() -> requests.Session:
+    """
+    Returns the calling thread's pooled HTTP session.
+    
+    Clients created on the same thread share keep-alive connections instead
+    of paying a new TCP/TLS handshake each time.
+    """
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        session.mount('https://', adapter)
+        if orjson is not None:
+            session.hooks['response'].append(_use_orjson)
+        _thread_local.session = session
+    return session
+
+def _use_orjson(response: requests.Response, *args, **kwargs) -> requests.Response:
+    """
+    Response hook that makes response.json() decode with orjson.
+    
+    spotipy parses every API response via response.json(); large search and
+    playlist pages decode several times faster this way. orjson's decode
+    error subclasses ValueError, so spotipy's error handling is unchanged.
+    """
+    response.json = lambda **kw: orjson.loads(response.content)
+    return response
+
 
 def _spotify_call(fn: Callable, retries: int = SPOTIFY_MAX_RETRIES, backoff: float = SPOTIFY_RETRY_BACKOFF_BASE) -> Optional[Any]:
     """Call a Spotify API function with simple retry/backoff for 429/5xx."""
@@ -76,13 +129,29 @@ def _spotify_call(fn: Callable, retries: int = SPOTIFY_MAX_RETRIES, backoff: flo
             logger.error(f"Unexpected Spotify call error: {e}")
             return None
 
+# Set to False (via --no-client-cache) to build a fresh client on every call
+CLIENT_CACHE_ENABLED = True
+
+# Clients built from a bare access token (no auth manager) can't refresh it;
+# Spotify tokens last an hour, so cached ones are rebuilt a bit before that
+_BARE_TOKEN_CLIENT_TTL = 50 * 60
+
 def get_spotify_client(username: Optional[str] = None, scope: str = DEFAULT_SCOPE) -> Optional[spotipy.Spotify]:
     """
     Returns an authenticated spotipy.Spotify client.
     
     If username is provided, attempts to use User Authorization (OAuth).
     Otherwise, falls back to Client Credentials (public data only).
+    
+    Clients are reused for the rest of the process per (username, scope),
+    so repeated calls skip re-reading the token cache from disk.
     """
+    if not CLIENT_CACHE_ENABLED:
+        return _create_spotify_client(username, scope)
+    return get_thread_spotify_client(username=username, scope=scope)
+
+def _create_spotify_client(username: Optional[str] = None, scope: str = DEFAULT_SCOPE) -> Optional[spotipy.Spotify]:
+    """Builds a new spotipy.Spotify client (see get_spotify_client)."""
     if username:
         # User Authorization with OAuth (supports automatic token refresh)
         try:
@@ -98,7 +167,7 @@ def get_spotify_client(username: Optional[str] = None, scope: str = DEFAULT_SCOP
             )
             
             # Disable internal retries to handle them manually and avoid long hangs
-            return spotipy.Spotify(auth_manager=auth_manager, requests_timeout=SPOTIFY_REQUEST_TIMEOUT, retries=0)
+            return spotipy.Spotify(auth_manager=auth_manager, requests_session=_http_session(), requests_timeout=SPOTIFY_REQUEST_TIMEOUT, retries=0)
         except Exception as e:
             logger.error(f"Error creating OAuth client: {e}")
             # Fallback to old method
@@ -111,7 +180,7 @@ def get_spotify_client(username: Optional[str] = None, scope: str = DEFAULT_SCOP
                     redirect_uri=settings.spotipy_redirect_uri
                 )
                 if token:
-                    return spotipy.Spotify(auth=token, requests_timeout=SPOTIFY_REQUEST_TIMEOUT, retries=0)
+                    return spotipy.Spotify(auth=token, requests_session=_http_session(), requests_timeout=SPOTIFY_REQUEST_TIMEOUT, retries=0)
                 else:
                     logger.error(f"Can't get token for {username}")
                     return None
@@ -125,7 +194,30 @@ def get_spotify_client(username: Optional[str] = None, scope: str = DEFAULT_SCOP
             client_secret=settings.spotipy_client_secret
         )
         # Disable internal retries to handle them manually and avoid long hangs
-        return spotipy.Spotify(client_credentials_manager=client_credentials_manager, requests_timeout=SPOTIFY_REQUEST_TIMEOUT, retries=0)
+        return spotipy.Spotify(client_credentials_manager=client_credentials_manager, requests_session=_http_session(), requests_timeout=SPOTIFY_REQUEST_TIMEOUT, retries=0)
+
+def get_thread_spotify_client(username: Optional[str] = None, scope: str = DEFAULT_SCOPE) -> Optional[spotipy.Spotify]:
+    """
+    Returns a Spotify client owned by the calling thread.
+    
+    Worker threads each get their own client (and HTTP session) so that
+    concurrent requests never share connection state.
+    """
+    clients = getattr(_thread_local, 'clients', None)
+    if clients is None:
+        clients = _thread_local.clients = {}
+    key = (username, scope)
+    cached = clients.get(key)
+    if cached is not None:
+        client, created = cached
+        # OAuth / client-credentials managers refresh their own tokens
+        if client.auth_manager is not None or time.monotonic() - created < _BARE_TOKEN_CLIENT_TTL:
+            return client
+    client = _create_spotify_client(username, scope)
+    # Don't cache failures so a later call can retry authentication
+    if client is not None:
+        clients[key] = (client, time.monotonic())
+    return client
 
 def confirm(prompt: Optional[str] = None, default: bool = False) -> bool:
     """
@@ -182,10 +274,12 @@ def show_all_playlists(username: str) -> Optional[Dict[str, Any]]:
         return _spotify_call(lambda: sp.user_playlists(username))
     return None
 
-def find_playlist_by_name(username: str, playlist_name: str) -> Optional[str]:
+def find_playlist_by_name(username: str, playlist_name: str, return_full: bool = False) -> Optional[Any]:
     """
     Finds a playlist ID by exact name match for a user.
     Searches through all playlists the user has access to, including Spotify-created ones.
+    With return_full=True the simplified playlist object from the scan is returned instead
+    of just its ID, saving callers a separate sp.playlist() lookup.
     """
     sp = get_spotify_client(username=username)
     if not sp:
@@ -202,7 +296,7 @@ def find_playlist_by_name(username: str, playlist_name: str) -> Optional[str]:
     while playlists:
         for playlist in playlists['items']:
             if playlist['name'] == playlist_name:
-                return playlist['id']
+                return playlist if return_full else playlist['id']
         
         if playlists['next']:
             playlists = _spotify_call(lambda: sp.next(playlists))
@@ -276,16 +370,7 @@ def get_playlist_track_signatures(username, playlist_id):
     signatures = set()
     results = sp.user_playlist_tracks(username, playlist_id)
     while results:
-        for item in results['items']:
-            if item['track']:
-                track = item['track']
-                name = track['name'].lower().strip()
-                # Use first artist for signature
-                artist = track['artists'][0]['name'].lower().strip() if track['artists'] else ""
-                # Round duration to nearest second (DURATION_BUCKET_SIZE_MS) to account for minor variations
-                duration = round(track['duration_ms'] / DURATION_BUCKET_SIZE_MS)
-                
-                signatures.add((name, artist, duration))
+        signatures.update(_basic_track_signature(item['track']) for item in results['items'] if item['track'])
         
         if results['next']:
             results = sp.next(results)
@@ -294,16 +379,26 @@ def get_playlist_track_signatures(username, playlist_id):
             
     return signatures
 
-def create_track_signature(track: Dict[str, Any]) -> Tuple[str, str, int]:
-    """Creates a signature tuple for a track object."""
-    if advanced_signature:
-        return advanced_signature(track)
-        
+def _basic_track_signature(track: Dict[str, Any]) -> Tuple[str, str, int]:
+    """(name, first artist, duration bucket) signature used without utils.track_deduplicator."""
     name = track['name'].lower().strip()
+    # Use first artist for signature
     artist = track['artists'][0]['name'].lower().strip() if track['artists'] else ""
+    # Round duration to nearest second (DURATION_BUCKET_SIZE_MS) to account for minor variations
     duration = round(track['duration_ms'] / DURATION_BUCKET_SIZE_MS)
     return (name, artist, duration)
 
+def create_track_signature(track: Dict[str, Any]) -> Tuple[str, str, int]:
+    """Creates a signature tuple for a track object."""
+    if advanced_signature:
+        return advanced_signature(track)
+    return _basic_track_signature(track)
+
+def create_track_signatures(tracks) -> List[Any]:
+    """Creates signatures for many tracks in one pass (same format as create_track_signature)."""
+    sig = advanced_signature or _basic_track_signature
+    return [sig(t) for t in tracks]
+
 def add_song_to_spotify_playlist(username: str, track_ids: List[str], playlist_id: str, sp: Optional[spotipy.Spotify] = None) -> None:
     """Adds songs to a playlist in Spotify."""
     if not sp:
@@ -311,13 +406,14 @@ def add_song_to_spotify_playlist(username: str, track_ids: List[str], playlist_i
     if not sp:
         return
 
-    # Spotify API limit is SPOTIFY_PLAYLIST_ADD_BATCH_SIZE tracks per request
+    # Spotify API limit is SPOTIFY_PLAYLIST_ADD_BATCH_SIZE tracks per request.
+    # Batches are appended in order, one at a time: concurrent appends would
+    # interleave and lose the caller's track order. A rate-limited batch is
+    # retried after Retry-After instead of being dropped.
     for i in range(0, len(track_ids), SPOTIFY_PLAYLIST_ADD_BATCH_SIZE):
         chunk = track_ids[i:i + SPOTIFY_PLAYLIST_ADD_BATCH_SIZE]
-        try:
-            sp.user_playlist_add_tracks(username, playlist_id, chunk)
-        except Exception as e:
-            logger.error(f"Error adding tracks: {e}")
+        if _spotify_call(lambda: sp.playlist_add_items(playlist_id, chunk)) is None:
+            logger.error(f"Error adding tracks {i + 1}-{i + len(chunk)} to playlist {playlist_id}")
 
 def remove_song_from_spotify_playlist(username, track_id, playlist_id):
     """Removes a song from a playlist in Spotify."""
@@ -470,19 +566,25 @@ def copy_missing_tracks_with_dedup(username: str, source_playlist_id: str, targe
             results = None
     
     # Find tracks to add (by ID and signature to avoid duplicates)
-    target_ids = set(t['id'] for t in target_tracks_before)
-    target_signatures = set(create_track_signature(t) for t in target_tracks_before)
+    target_ids = {t['id'] for t in target_tracks_before}
+    target_signatures = {create_track_signature(t) for t in target_tracks_before}
     
     to_add = []
+    append = to_add.append
+    add_id = target_ids.add
+    add_sig = target_signatures.add
     for track in source_tracks:
         # Check both ID and signature to avoid all types of duplicates
-        if track['id'] not in target_ids:
-            sig = create_track_signature(track)
-            if sig not in target_signatures:
-                to_add.append(track)
-                # Add to sets to prevent duplicates within the batch
-                target_ids.add(track['id'])
-                target_signatures.add(sig)
+        tid = track['id']
+        if tid in target_ids:
+            continue
+        sig = create_track_signature(track)
+        if sig in target_signatures:
+            continue
+        # Add to sets to prevent duplicates within the batch
+        add_id(tid)
+        add_sig(sig)
+        append(track)
     
     result = {
         'source_count': len(source_tracks),
@@ -675,6 +777,163 @@ def get_track_info(item, album_data=None):
 
     return track_info
 
+def get_access_token(sp: spotipy.Spotify) -> Optional[str]:
+    """Returns the bearer token behind a spotipy client, refreshing it if expired."""
+    auth_manager = getattr(sp, 'auth_manager', None)
+    if auth_manager is not None:
+        return auth_manager.get_access_token(as_dict=False)
+    return getattr(sp, '_auth', None)
+
+async def _api_get_async(session, semaphore, sp, token, path, params, max_retries=SPOTIFY_MAX_RETRIES):
+    """
+    GETs a Web API path under the semaphore, retrying on 401/429/5xx.
+    
+    Every attempt (retries included) takes a token from the shared
+    concurrent Spotify bucket, so parallel requests stay within its budget.
+    Retry sleeps happen outside the semaphore so they don't hold a slot.
+    token is a one-element list shared by all requests so a refresh after
+    a 401 is picked up by every in-flight request.
+    """
+    limiter = get_rate_limiter()
+    status, message = None, 'no attempts made'
+    for attempt in range(max_retries):
+        async with semaphore:
+            await limiter.acquire('spotify_concurrent')
+            headers = {'Authorization': f"Bearer {token[0]}"}
+            async with session.get(f"{SPOTIFY_API_BASE}{path}", params=params, headers=headers) as resp:
+                if resp.status == 200:
+                    return await resp.json(loads=orjson.loads) if orjson else await resp.json()
+                status = resp.status
+                retry_after = resp.headers.get('Retry-After')
+                message = await resp.text()
+
+        if attempt == max_retries - 1 or not (status in (401, 429) or status >= 500):
+            break
+        if status == 401:
+            # Token expired - the auth manager refreshes it on request
+            logger.warning(f"Token expired during request, retrying... (attempt {attempt + 1}/{max_retries})")
+            token[0] = get_access_token(sp)
+            await asyncio.sleep(1)
+        elif status == 429:
+            await asyncio.sleep(int(retry_after) if retry_after else SPOTIFY_RETRY_BACKOFF_BASE ** attempt)
+        else:
+            await asyncio.sleep(SPOTIFY_RETRY_BACKOFF_BASE ** attempt)
+    raise spotipy.exceptions.SpotifyException(status, -1, f"GET {path} failed: {message}")
+
+async def _search_tracks_async(session, semaphore, sp, token, query, limit):
+    """Runs one track search against the Web API."""
+    params = {'q': query, 'type': 'track', 'limit': limit}
+    data = await _api_get_async(session, semaphore, sp, token, '/search', params)
+    return data['tracks']['items']
+
+async def _search_tracks_many_async(sp, queries, limit, concurrency, on_done):
+    """Gathers _search_tracks_async over all queries under one session."""
+    token = [get_access_token(sp)]
+    semaphore = asyncio.Semaphore(concurrency)
+    timeout = aiohttp.ClientTimeout(total=SPOTIFY_REQUEST_TIMEOUT)
+
+    async def search_one(session, query):
+        try:
+            return await _search_tracks_async(session, semaphore, sp, token, query, limit)
+        finally:
+            if on_done:
+                on_done(query)
+
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await asyncio.gather(
+            *(search_one(session, q) for q in queries),
+            return_exceptions=True,
+        )
+
+def search_tracks_many(sp: spotipy.Spotify, queries: List[str], limit: int = 50,
+                       concurrency: int = SPOTIFY_SEARCH_WORKERS,
+                       on_done: Optional[Callable[[str], None]] = None,
+                       username: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Runs track searches for many queries concurrently, paced by the shared
+    Spotify rate limiter.
+    
+    Returns a dict of query -> track items. Queries whose search failed are
+    left out (and logged at debug level). on_done is called once per query
+    as it finishes (always on the calling thread), e.g. to advance a progress bar.
+    Without aiohttp the searches run on `concurrency` threads, each with its
+    own client (for username, or client credentials if None).
+    """
+    results = {}
+    if aiohttp is None:
+        limiter = get_rate_limiter()
+
+        def search_one(query):
+            thread_sp = get_thread_spotify_client(username=username) or sp
+            limiter.wait('spotify_concurrent')
+            data = _spotify_call(lambda: thread_sp.search(q=query, limit=limit, type='track'))
+            if data is None:
+                raise RuntimeError("search failed")
+            return data['tracks']['items']
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {executor.submit(search_one, query): query for query in queries}
+            for future in as_completed(futures):
+                query = futures[future]
+                try:
+                    results[query] = future.result()
+                except Exception as e:
+                    logger.debug(f"Search query '{query}' failed: {e}")
+                if on_done:
+                    on_done(query)
+        return results
+
+    outcomes = asyncio.run(_search_tracks_many_async(sp, queries, limit, concurrency, on_done))
+    for query, outcome in zip(queries, outcomes):
+        if isinstance(outcome, Exception):
+            logger.debug(f"Search query '{query}' failed: {outcome}")
+        else:
+            results[query] = outcome
+    return results
+
+async def _fetch_playlist_pages_async(sp, playlist_id, offsets, params, concurrency):
+    """Gathers the playlist item pages at the given offsets under one session."""
+    token = [get_access_token(sp)]
+    semaphore = asyncio.Semaphore(concurrency)
+    timeout = aiohttp.ClientTimeout(total=SPOTIFY_REQUEST_TIMEOUT)
+    path = f"/playlists/{playlist_id}/tracks"
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await asyncio.gather(*(
+            _api_get_async(session, semaphore, sp, token, path, {**params, 'offset': offset})
+            for offset in offsets
+        ))
+
+def fetch_playlist_items(sp: spotipy.Spotify, playlist_id: str, fields: Optional[str] = None,
+                         concurrency: int = SPOTIFY_PAGE_WORKERS) -> List[Dict[str, Any]]:
+    """
+    Fetches every item of a playlist.
+    
+    The first page reports the total, after which all remaining pages are
+    requested concurrently by offset rather than by following 'next' links.
+    Falls back to sequential pagination when aiohttp is not installed.
+    fields, if given, must include 'total' and 'next'.
+    """
+    page_size = 100
+    results = sp.playlist_items(playlist_id, fields=fields, limit=page_size, additional_types=('track',))
+    items = results['items']
+    if not results.get('next'):
+        return items
+
+    if aiohttp is None:
+        while results['next']:
+            results = sp.next(results)
+            items.extend(results['items'])
+        return items
+
+    params = {'limit': page_size, 'additional_types': 'track'}
+    if fields:
+        params['fields'] = fields
+    offsets = range(page_size, results['total'], page_size)
+    # gather preserves argument order, so pages come back in playlist order
+    for page in asyncio.run(_fetch_playlist_pages_async(sp, playlist_id, offsets, params, concurrency)):
+        items.extend(page['items'])
+    return items
+
 def search(sp, query, limit=50, offset=0, fetch_all=False):
     """Searches given users input and returns results.
     
@@ -786,10 +1045,15 @@ def search(sp, query, limit=50, offset=0, fetch_all=False):
 def search_tracks_by_year(sp, label, year, market='US'):
     """
     Helper to search for tracks in a specific year.
+
+    Year searches run on worker pools, so every page request takes a token
+    from the concurrent Spotify bucket.
     """
     query = f"label:\"{label}\" year:{year}"
     tracks = []
+    limiter = get_rate_limiter()
     try:
+        limiter.wait('spotify_concurrent')
         results = _spotify_call(lambda: sp.search(query, limit=50, type='track', market=market))
         if not results:
             return []
@@ -797,6 +1061,7 @@ def search_tracks_by_year(sp, label, year, market='US'):
         page = results['tracks']
         tracks.extend(page.get('items', []))
         while page.get('next'):
+            limiter.wait('spotify_concurrent')
             page = _spotify_call(lambda: sp.next(page))
             if not page:
                 break
@@ -806,30 +1071,54 @@ def search_tracks_by_year(sp, label, year, market='US'):
     
     return tracks
 
-def search_tracks_exhaustive(sp, label, market='US'):
+def search_tracks_exhaustive(sp, label, market='US', username=None):
     """
     Searches for tracks by label, iterating through years to bypass the 1000-item search limit.
+    
+    Years are independent searches, so they run concurrently on
+    SPOTIFY_SEARCH_WORKERS threads. Each worker uses its own client (for
+    username, or client credentials if None), falling back to sp; page
+    requests are paced by search_tracks_by_year.
     """
     # Use %s formatting to avoid issues with special characters like $ in label names
     logger.info("Searching for tracks by label: '%s' (Exhaustive Search)...", label)
     
-    all_tracks = []
-    seen_ids = set()
-    
     current_year = datetime.datetime.now().year
     start_year = 1950 # Adjust if needed
-    
-    for year in range(start_year, current_year + 2):
-        # logger.info(f"Scanning year {year}...") # Too verbose for info?
-        print(f"Scanning year {year}...", end='\r') # Keep print for progress bar effect
-        year_tracks = search_tracks_by_year(sp, label, year, market)
-        
-        for track in year_tracks:
-            if track['id'] not in seen_ids:
-                seen_ids.add(track['id'])
-                all_tracks.append(track)
+    years = range(start_year, current_year + 2)
+
+    def search_year(year):
+        year_sp = get_thread_spotify_client(username) or sp
+        return search_tracks_by_year(year_sp, label, year, market)
+
+    tracks_by_year = {}
+    with ThreadPoolExecutor(max_workers=SPOTIFY_SEARCH_WORKERS) as executor:
+        futures = {executor.submit(search_year, year): year for year in years}
+        if console:
+            with Progress(
+                TextColumn("[cyan]Scanning years[/cyan]"),
+                BarColumn(),
+                TaskProgressColumn(),
+                TimeRemainingColumn(),
+                console=console,
+                transient=True
+            ) as progress:
+                task = progress.add_task("years", total=len(years))
+                for future in as_completed(futures):
+                    tracks_by_year[futures[future]] = future.result()
+                    progress.advance(task)
+        else:
+            for future in as_completed(futures):
+                tracks_by_year[futures[future]] = future.result()
+
+    # Merge in year order so results are deterministic
+    found_by_id = {}
+    for year in years:
+        for track in tracks_by_year[year]:
+            found_by_id.setdefault(track['id'], track)
+    all_tracks = list(found_by_id.values())
                 
-    logger.info(f"\nFinished scanning. Found {len(all_tracks)} unique tracks.")
+    logger.info(f"Finished scanning. Found {len(all_tracks)} unique tracks.")
     return all_tracks
 
 
@@ -1052,16 +1341,62 @@ def validate_tracks_list(sp, tracks, target_label, selection=None, auto_mode=Fal
     logger.info(f"Excluded {excluded_count} tracks based on label validation.")
     return tracks_to_keep
 
-def fetch_all_user_playlists(username):
+def iter_pages_prefetched(sp: spotipy.Spotify, first_page: Optional[Dict[str, Any]], prefetch: int = 2):
     """
-    Fetches ALL playlists for a user (handling pagination).
+    Yields paging objects starting at first_page, following 'next' links.
+    
+    A background thread fetches the following pages while the caller is
+    still processing the current one, overlapping network latency with work.
+    Errors raised while fetching are re-raised in the caller's thread.
+    If the caller stops early (break, exception, close), the thread is told
+    to stop and exits instead of blocking on the full queue.
+    """
+    pages: "queue.Queue" = queue.Queue(maxsize=prefetch)
+    done = object()
+    stop = threading.Event()
+
+    def put(item):
+        # Returns False once the consumer has gone away
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch():
+        page = first_page
+        try:
+            while page and not stop.is_set():
+                if not put(page):
+                    return
+                page = sp.next(page) if page.get('next') else None
+        except Exception as e:
+            put(e)
+        put(done)
+
+    threading.Thread(target=fetch, daemon=True).start()
+    try:
+        while True:
+            page = pages.get()
+            if page is done:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        stop.set()
+
+def iter_all_user_playlists(username):
+    """
+    Yields ALL playlists for a user, page by page.
     Includes both user-created and Spotify-created playlists (like Discover Weekly).
+    The next page is prefetched in the background while the caller works on the current one.
     """
     sp = get_spotify_client(username=username)
     if not sp:
-        return []
-    
-    playlists = []
+        return
     
     # Try current_user_playlists first (gets all playlists including Spotify-created)
     try:
@@ -1070,14 +1405,15 @@ def fetch_all_user_playlists(username):
         # Fallback to user_playlists if current_user fails
         results = sp.user_playlists(username)
     
-    while results:
-        playlists.extend(results['items'])
-        if results['next']:
-            time.sleep(0.2) # Rate limit protection
-            results = sp.next(results)
-        else:
-            results = None
-    return playlists
+    for page in iter_pages_prefetched(sp, results):
+        yield from page['items']
+
+def fetch_all_user_playlists(username):
+    """
+    Fetches ALL playlists for a user (handling pagination).
+    Includes both user-created and Spotify-created playlists (like Discover Weekly).
+    """
+    return list(iter_all_user_playlists(username))
 
 def find_duplicates_in_playlist(username, playlist_id):
     """
@@ -1091,10 +1427,14 @@ def find_duplicates_in_playlist(username, playlist_id):
     seen_signatures = {} # (name, artist, duration) -> track_obj
     duplicates = []
 
+    # Every page request takes a token from the shared Spotify bucket, so
+    # concurrent scans stay under the API limit together
+    limiter = get_rate_limiter()
+
     # We need to handle pagination manually to process all tracks
+    limiter.wait('spotify')
     results = sp.user_playlist_tracks(username, playlist_id)
     position = 0
-    page_count = 0
     
     while results:
         for item in results['items']:
@@ -1119,14 +1459,7 @@ def find_duplicates_in_playlist(username, playlist_id):
             position += 1
         
         if results['next']:
-            page_count += 1
-            # Add delay between pagination requests to avoid rate limiting
-            # Increase delay every 10 pages to be extra cautious
-            if page_count % 10 == 0:
-                time.sleep(0.5)
-            else:
-                time.sleep(0.1)
-            
+            limiter.wait('spotify')
             try:
                 results = sp.next(results)
             except Exception as e:
@@ -1144,29 +1477,32 @@ def remove_specific_occurrences(username, playlist_id, tracks_with_positions, pr
     """
     Removes specific occurrences of tracks from a playlist.
     tracks_with_positions: list of {'uri': str, 'positions': [int]}
-    progress_callback: function(count) called after each chunk is removed
+    progress_callback: function(count) called with the number of occurrences removed by each request
     """
     sp = get_spotify_client(username=username, scope="playlist-modify-private playlist-modify-public")
     if not sp:
         return
 
-    # Spotify allows removing max 100 items per request
-    # The structure for remove_specific_occurrences_of_tracks is:
-    # { "tracks": [{ "uri": "spotify:track:...", "positions": [0, 2] }] }
-    # But the spotipy method takes a list of items directly.
-    
-    # Group by URI for efficiency (though positions are unique per call usually)
-    # Actually, spotipy's user_playlist_remove_specific_occurrences_of_tracks takes:
-    # playlist_id, tracks
-    # where tracks is a list of dicts like: { "uri": "...", "positions": [0, 2] }
+    # Spotify allows removing max 100 items per request, where each item is
+    # { "uri": "spotify:track:...", "positions": [0, 2] }.
+    # Every request shifts the positions after the ones it removed, so remove
+    # from the end of the playlist first: each batch then only holds positions
+    # below everything already deleted and the remaining indices stay valid.
+    occurrences = sorted(
+        ((pos, t['uri']) for t in tracks_with_positions for pos in t['positions']),
+        reverse=True
+    )
     
-    # Let's process in chunks of 100 items
-    for i in range(0, len(tracks_with_positions), 100):
-        chunk = tracks_with_positions[i:i+100]
+    for i in range(0, len(occurrences), 100):
+        batch = occurrences[i:i+100]
+        positions_by_uri = defaultdict(list)
+        for pos, uri in batch:
+            positions_by_uri[uri].append(pos)
+        chunk = [{'uri': uri, 'positions': positions} for uri, positions in positions_by_uri.items()]
         try:
             _spotify_call(lambda: sp.user_playlist_remove_specific_occurrences_of_tracks(username, playlist_id, chunk))
             if progress_callback:
-                progress_callback(len(chunk))
+                progress_callback(len(batch))
             else:
                 logger.debug(f"Removed chunk {i//100 + 1}...")
         except Exception as e:
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Quick test script for the paging helpers
+Tests Discogs page discovery, the Spotify page prefetcher and playlist
+offset stitching against fake clients, without making real API calls
+"""
+import threading
+import time
+
+import spotifaj_functions
+from clients.discogs_client import DiscogsClient
+
+
+def fake_releases(last_page):
+    """fetch_releases callable with `last_page` non-empty pages; records probes"""
+    calls = []
+
+    def fetch(page):
+        calls.append(page)
+        return [{'id': page}] if page <= last_page else []
+    return fetch, calls
+
+
+def test_discover_last_page():
+    """The probe finds the last non-empty page in O(log P) requests"""
+    client = DiscogsClient.__new__(DiscogsClient)
+    for last_page in (1, 2, 3, 7, 8, 9, 64, 100):
+        fetch, calls = fake_releases(last_page)
+        assert client._discover_last_page(fetch, max_pages=1000) == last_page
+        assert len(calls) <= 2 * last_page.bit_length() + 1
+
+
+def test_discover_last_page_limit_and_errors():
+    """Probing stops at max_pages, and failed probes count as empty pages"""
+    client = DiscogsClient.__new__(DiscogsClient)
+    fetch, calls = fake_releases(500)
+    assert client._discover_last_page(fetch, max_pages=20) == 20
+    assert max(calls) <= 20
+
+    def flaky(page):
+        if page > 5:
+            raise RuntimeError("boom")
+        return [{'id': page}]
+    assert client._discover_last_page(flaky, max_pages=100) == 5
+
+
+class FakePager:
+    """Minimal spotipy stand-in serving numbered pages through next()"""
+
+    def __init__(self, total_pages, fail_at=None):
+        self.total_pages = total_pages
+        self.fail_at = fail_at
+        self.fetched = []
+
+    def page(self, number):
+        has_next = number < self.total_pages
+        return {'number': number, 'items': [number], 'next': f"page/{number + 1}" if has_next else None}
+
+    def next(self, page):
+        number = page['number'] + 1
+        if number == self.fail_at:
+            raise RuntimeError(f"page {number} failed")
+        self.fetched.append(number)
+        return self.page(number)
+
+
+def test_prefetch_yields_pages_in_order():
+    """Every page is yielded once, in 'next' order"""
+    sp = FakePager(25)
+    pages = list(spotifaj_functions.iter_pages_prefetched(sp, sp.page(1)))
+    assert [p['number'] for p in pages] == list(range(1, 26))
+    assert list(spotifaj_functions.iter_pages_prefetched(sp, None)) == []
+
+
+def test_prefetch_reraises_errors():
+    """A failed fetch is raised in the consumer after the pages before it"""
+    sp = FakePager(10, fail_at=4)
+    seen = []
+    try:
+        for page in spotifaj_functions.iter_pages_prefetched(sp, sp.page(1)):
+            seen.append(page['number'])
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected the fetch error to be re-raised")
+    assert seen == [1, 2, 3]
+
+
+def test_prefetch_stops_when_consumer_quits():
+    """Breaking out early stops the background thread"""
+    before = threading.active_count()
+    sp = FakePager(1000)
+    for page in spotifaj_functions.iter_pages_prefetched(sp, sp.page(1), prefetch=2):
+        if page['number'] == 3:
+            break
+    deadline = time.time() + 5
+    while threading.active_count() > before and time.time() < deadline:
+        time.sleep(0.05)
+    assert threading.active_count() == before
+    assert len(sp.fetched) < 10
+
+
+class FakePlaylist:
+    """spotipy stand-in for playlist_items() over a playlist of `total` items"""
+
+    def __init__(self, total):
+        self.total = total
+
+    def playlist_items(self, playlist_id, fields=None, limit=100, offset=0, additional_types=('track',)):
+        items = [{'position': i} for i in range(offset, min(offset + limit, self.total))]
+        has_next = offset + limit < self.total
+        return {'items': items, 'total': self.total, 'offset': offset,
+                'next': f"offset={offset + limit}" if has_next else None}
+
+
+def test_fetch_playlist_items_stitches_offsets():
+    """Concurrently fetched pages are stitched back in playlist order"""
+    sp = FakePlaylist(450)
+    requested = []
+
+    async def fake_pages(sp_, playlist_id, offsets, params, concurrency):
+        requested.extend(offsets)
+        # Answer in reverse to make sure ordering comes from the offsets
+        pages = {offset: sp.playlist_items(playlist_id, limit=params['limit'], offset=offset)
+                 for offset in reversed(offsets)}
+        return [pages[offset] for offset in offsets]
+
+    saved = spotifaj_functions.aiohttp, spotifaj_functions._fetch_playlist_pages_async
+    spotifaj_functions.aiohttp = object()
+    spotifaj_functions._fetch_playlist_pages_async = fake_pages
+    try:
+        items = spotifaj_functions.fetch_playlist_items(sp, 'playlist')
+    finally:
+        spotifaj_functions.aiohttp, spotifaj_functions._fetch_playlist_pages_async = saved
+
+    assert requested == [100, 200, 300, 400]
+    assert [item['position'] for item in items] == list(range(450))
+
+
+if __name__ == '__main__':
+    print("Testing paging helpers...\n")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✓ {name}")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Quick test script for the shared token-bucket rate limiter
+Tests reserve/refill arithmetic without sleeping on real API budgets
+"""
+import time
+
+from utils.rate_limiter import TokenBucket, RateLimiter, get_rate_limiter
+
+
+def make_bucket(rate_per_minute, capacity=None):
+    """Bucket without safety buffer or jitter, so waits are exact."""
+    return TokenBucket(rate_per_minute, capacity, safety_buffer=0.0, jitter=0.0)
+
+
+def test_full_bucket_allows_burst():
+    """A full bucket serves `capacity` requests without waiting"""
+    bucket = make_bucket(60, capacity=5)
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+    assert bucket.reserve() > 0
+
+
+def test_debt_wait_matches_rate():
+    """Each request past the capacity waits one more refill interval"""
+    bucket = make_bucket(120, capacity=1)  # one token every 0.5s
+    assert bucket.reserve() == 0.0
+    first = bucket.reserve()
+    second = bucket.reserve()
+    assert 0.49 < first <= 0.5
+    assert 0.99 < second <= 1.0
+    assert bucket.tokens < -1.9
+
+
+def test_reserve_many_at_once():
+    """Reserving n tokens costs the same as n single reservations"""
+    bucket = make_bucket(60, capacity=2)
+    wait = bucket.reserve(5)
+    assert 2.99 < wait <= 3.0
+
+
+def test_refill_is_capped_at_capacity():
+    """Idle time never builds up more than `capacity` tokens"""
+    bucket = make_bucket(60_000, capacity=3)  # 1000 tokens per second
+    bucket.reserve(3)
+    time.sleep(0.05)
+    assert bucket.reserve(0) == 0.0
+    assert bucket.tokens == 3.0
+
+
+def test_fractional_rate():
+    """Rates that aren't whole requests per minute still pace correctly"""
+    bucket = make_bucket(60 / 0.7, capacity=1)
+    bucket.reserve()
+    wait = bucket.reserve()
+    assert 0.69 < wait <= 0.701
+
+
+def test_registry():
+    """Buckets are looked up by key; unknown keys raise KeyError"""
+    limiter = RateLimiter()
+    bucket = limiter.configure('test', 30, capacity=2)
+    assert limiter.bucket('test') is bucket
+    try:
+        limiter.bucket('missing')
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("expected KeyError for an unconfigured key")
+
+
+def test_default_limiter_buckets():
+    """The process-wide limiter has a bucket for each API"""
+    from constants import SPOTIFY_SEARCH_WORKERS, SPOTIFY_PAGE_WORKERS
+
+    limiter = get_rate_limiter()
+    assert limiter is get_rate_limiter()
+    assert limiter.bucket('spotify').capacity == 1
+    assert limiter.bucket('discogs').capacity >= 1
+    concurrent = limiter.bucket('spotify_concurrent')
+    assert concurrent.capacity >= max(SPOTIFY_SEARCH_WORKERS, SPOTIFY_PAGE_WORKERS)
+
+
+if __name__ == '__main__':
+    print("Testing TokenBucket / RateLimiter...\n")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✓ {name}")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Quick test script for the track-matching normalization helpers
+Tests normalize_text_for_matching and strip_track_suffixes on known titles
+"""
+from spotifaj import normalize_text_for_matching, strip_track_suffixes
+
+
+def test_normalize_text_for_matching():
+    """Separators, "vs" and pipes normalize to plain lowercase words"""
+    cases = {
+        "Theorem vs. Swayzak": "theorem swayzak",
+        "Theorem, Swayzak": "theorem swayzak",
+        "Theorem v Swayzak": "theorem swayzak",
+        "Aphex Twin | Warp Records": "aphex twin",
+        "Boards—of–Canada": "boards of canada",
+        "AC/DC": "ac dc",
+        "  Lots   of\tspace  ": "lots of space",
+        "": "",
+        None: "",
+    }
+    for raw, expected in cases.items():
+        assert normalize_text_for_matching(raw) == expected, (raw, normalize_text_for_matching(raw))
+
+
+def test_strip_track_suffixes():
+    """Version suffixes are cut from the first match to the end"""
+    cases = {
+        "windowlicker radio edit": "windowlicker",
+        "xtal original mix": "xtal",
+        "flim album version": "flim",
+        "girl single edit extended": "girl",
+        "avril 14th remix by someone": "avril 14th",
+        "come to daddy remastered": "come to daddy",
+        # The year before "remaster" has always been kept
+        "song 2011 remaster": "song 2011",
+        "plain title": "plain title",
+    }
+    for raw, expected in cases.items():
+        assert strip_track_suffixes(raw) == expected, (raw, strip_track_suffixes(raw))
+
+
+def test_strip_track_version_tails():
+    """A trailing "minus" is removed before a trailing "plus" """
+    assert strip_track_suffixes("foo minus") == "foo"
+    assert strip_track_suffixes("foo plus") == "foo"
+    assert strip_track_suffixes("foo plus minus") == "foo"
+    assert strip_track_suffixes("foo minus plus") == "foo minus"
+    assert strip_track_suffixes("foo plus plus") == "foo plus"
+    assert strip_track_suffixes("foo minus remix") == "foo"
+    assert strip_track_suffixes("plus") == "plus"
+
+
+if __name__ == '__main__':
+    print("Testing track matching normalization...\n")
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✓ {name}")
@@ -8,28 +8,66 @@ import json
 import logging
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 logger = logging.getLogger('cache_manager')
 
+CACHE_FILE_EXTENSIONS = {'json': '.json', 'msgpack': '.mpk'}
+
 class CacheManager:
     """Manages caching of API results with versioning and expiration."""
     
-    def __init__(self, cache_dir='cache', expiry_days=7):
+    def __init__(self, cache_dir='cache', expiry_days=7, cache_format='json'):
         """
         Initialize with the given cache directory and default expiry.
         
         Args:
             cache_dir: Directory to store cache files
             expiry_days: Default number of days until cache entries expire
+            cache_format: File format for new entries, "json" or "msgpack"
         """
         self.cache_dir = cache_dir
         self.default_expiry_days = expiry_days
+        
+        if cache_format == 'msgpack' and msgpack is None:
+            logger.warning("msgpack not installed, falling back to JSON cache files")
+            cache_format = 'json'
+        elif cache_format not in CACHE_FILE_EXTENSIONS:
+            logger.warning(f"Unknown cache format '{cache_format}', falling back to JSON cache files")
+            cache_format = 'json'
+        self.cache_format = cache_format
+        
         os.makedirs(cache_dir, exist_ok=True)
         logger.debug(f"Initialized CacheManager with directory: {cache_dir}, expiry: {expiry_days} days")
     
     def get_cache_path(self, cache_key):
         """Get the file path for a cache key."""
         safe_key = cache_key.replace('/', '_').replace('\\', '_')
-        return os.path.join(self.cache_dir, f"{safe_key}.json")
+        return os.path.join(self.cache_dir, f"{safe_key}{CACHE_FILE_EXTENSIONS[self.cache_format]}")
+    
+    def _serialize(self, cache_data):
+        """Encode a cache entry in the configured format."""
+        if self.cache_format == 'msgpack':
+            return msgpack.packb(cache_data, use_bin_type=True)
+        if orjson is not None:
+            return orjson.dumps(cache_data, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(cache_data).encode('utf-8')
+    
+    def _deserialize(self, raw):
+        """Decode a cache entry written in the configured format."""
+        if self.cache_format == 'msgpack':
+            return msgpack.unpackb(raw, raw=False)
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
     
     def load_from_cache(self, cache_key, max_age_days=None):
         """
@@ -53,8 +91,8 @@ class CacheManager:
             return None
             
         try:
-            with open(cache_file, 'r') as f:
-                cache_data = json.load(f)
+            with open(cache_file, 'rb') as f:
+                cache_data = self._deserialize(f.read())
                 
             # Check cache version
             version = cache_data.get('version', '1.0')
@@ -90,7 +128,8 @@ class CacheManager:
             logger.debug(f"Cache hit: {cache_key}")
             return cache_data.get('data')
             
-        except json.JSONDecodeError:
+        except ValueError:
+            # json/orjson decode errors and msgpack unpack errors are all ValueErrors
             logger.warning(f"Corrupted cache file: {cache_file}")
             return None
         except Exception as e:
@@ -122,8 +161,8 @@ class CacheManager:
                     datetime.now() + timedelta(days=self.default_expiry_days)
                 ).isoformat()
             
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            with open(cache_file, 'wb') as f:
+                f.write(self._serialize(cache_data))
                 
             logger.debug(f"Saved to cache: {cache_key} ({len(str(data))} bytes)")
             return True
@@ -157,7 +196,7 @@ class CacheManager:
         else:
             # Clear all cache files
             for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
+                if filename.endswith(tuple(CACHE_FILE_EXTENSIONS.values())):
                     try:
                         os.remove(os.path.join(self.cache_dir, filename))
                         count += 1
@@ -0,0 +1,162 @@
+"""
+Rate Limiter
+------------
+Shared token-bucket rate limiting for the Spotify and Discogs clients.
+A single limiter instance per process keeps every API's budget in one place.
+"""
+import time
+import random
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger('rate_limiter')
+
+_NS_PER_MINUTE = 60_000_000_000
+_RATE_SCALE = 1000  # Rates are held in thousandths of a request per minute
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled on the monotonic clock.
+
+    Callers reserve tokens up front and may drive the bucket into debt;
+    the returned wait time pays that debt off, so the lock is never held
+    while sleeping and sync and async callers can share one bucket.
+
+    The level is kept as an integer count of units, where one nanosecond
+    of refill adds the scaled rate, so no rounding drift accumulates.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None,
+                 safety_buffer: float = 0.1, jitter: float = 0.1):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate_per_minute: Sustained number of requests allowed per minute
+            capacity: Maximum burst size (defaults to rate_per_minute)
+            safety_buffer: Extra seconds added to every non-zero wait
+            jitter: Fractional random spread applied to waits (0.1 = +/-10%)
+        """
+        self.rate_per_minute = rate_per_minute
+        self.capacity = float(capacity if capacity is not None else rate_per_minute)
+        self.safety_buffer = safety_buffer
+        self.jitter = jitter
+        self._rate = max(1, round(rate_per_minute * _RATE_SCALE))  # Units per nanosecond
+        self._token_units = _NS_PER_MINUTE * _RATE_SCALE
+        self._capacity_units = round(self.capacity * self._token_units)
+        self._units = self._capacity_units  # Start with full bucket
+        self._last_ns = time.monotonic_ns()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (negative while in debt)."""
+        return self._units / self._token_units
+
+    def _refill(self):
+        """Add tokens for the time elapsed since the last refill."""
+        now_ns = time.monotonic_ns()
+        self._units = min(self._capacity_units, self._units + (now_ns - self._last_ns) * self._rate)
+        self._last_ns = now_ns
+
+    def reserve(self, n: int = 1) -> float:
+        """
+        Take n tokens and return how many seconds the caller must wait.
+
+        Args:
+            n: Number of tokens (requests) to reserve
+
+        Returns:
+            Seconds to sleep before issuing the requests (0.0 if none)
+        """
+        with self._lock:
+            self._refill()
+            self._units -= n * self._token_units
+            if self._units >= 0:
+                return 0.0
+            wait_ns = -(self._units // self._rate)  # Ceiling division
+
+        wait_time = wait_ns / 1e9 + self.safety_buffer
+        return wait_time * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def wait(self, n: int = 1):
+        """Block until n tokens are available."""
+        wait_time = self.reserve(n)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def acquire(self, n: int = 1):
+        """Asynchronously wait until n tokens are available."""
+        wait_time = self.reserve(n)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+
+class RateLimiter:
+    """
+    Registry of named token buckets, one per API.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, key: str, rate_per_minute: float, capacity: Optional[float] = None) -> TokenBucket:
+        """
+        Create or replace the bucket for an API.
+
+        Args:
+            key: API name, e.g. "discogs" or "spotify"
+            rate_per_minute: Sustained number of requests allowed per minute
+            capacity: Maximum burst size (defaults to rate_per_minute)
+        """
+        bucket = TokenBucket(rate_per_minute, capacity)
+        with self._lock:
+            self._buckets[key] = bucket
+        return bucket
+
+    def bucket(self, key: str) -> TokenBucket:
+        """Get the bucket for an API."""
+        try:
+            return self._buckets[key]
+        except KeyError:
+            raise KeyError(f"No rate limit configured for '{key}'") from None
+
+    def wait(self, key: str, n: int = 1):
+        """Block until n requests to the given API are allowed."""
+        self.bucket(key).wait(n)
+
+    async def acquire(self, key: str, n: int = 1):
+        """Asynchronously wait until n requests to the given API are allowed."""
+        await self.bucket(key).acquire(n)
+
+
+_default_limiter: Optional[RateLimiter] = None
+_default_lock = threading.Lock()
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the process-wide rate limiter, configured from constants on first use.
+    """
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            from constants import (
+                DISCOGS_RATE_LIMIT_PER_MINUTE,
+                SPOTIFY_MIN_REQUEST_INTERVAL,
+                SPOTIFY_CONCURRENT_PER_MINUTE,
+                SPOTIFY_SEARCH_WORKERS,
+                SPOTIFY_PAGE_WORKERS,
+            )
+
+            limiter = RateLimiter()
+            limiter.configure('discogs', DISCOGS_RATE_LIMIT_PER_MINUTE)
+            # Capacity 1 keeps the strict minimum spacing between Spotify requests
+            limiter.configure('spotify', 60.0 / SPOTIFY_MIN_REQUEST_INTERVAL, capacity=1)
+            # Concurrent workers share a larger budget; a full pool may start at once
+            limiter.configure('spotify_concurrent', SPOTIFY_CONCURRENT_PER_MINUTE,
+                              capacity=max(SPOTIFY_SEARCH_WORKERS, SPOTIFY_PAGE_WORKERS))
+            _default_limiter = limiter
+        return _default_limiter
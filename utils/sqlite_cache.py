@@ -8,12 +8,32 @@ import sqlite3
 import json
 import time
 import logging
+import threading
 from pathlib import Path
 from typing import Any, Optional, Dict
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger('sqlite_cache')
 
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode('utf-8')
+
+
+def _loads(data) -> Any:
+    """Deserialize JSON from bytes or str, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class SQLiteCache:
     """
     SQLite-based cache manager for improved performance.
@@ -102,8 +122,8 @@ class SQLiteCache:
                 return None
             
             try:
-                return json.loads(value_json)
-            except json.JSONDecodeError:
+                return _loads(value_json)
+            except ValueError:
                 logger.error(f"Failed to decode cached value for key: {key}")
                 return None
     
@@ -125,8 +145,8 @@ class SQLiteCache:
         expires_at = now + (expiry_days * 24 * 3600)
         
         try:
-            value_json = json.dumps(value)
-            metadata_json = json.dumps(metadata) if metadata else None
+            value_json = _dumps(value).decode('utf-8')
+            metadata_json = _dumps(metadata).decode('utf-8') if metadata else None
             
             with sqlite3.connect(str(self.db_path)) as conn:
                 conn.execute("""
@@ -135,7 +155,7 @@ class SQLiteCache:
                     VALUES (?, ?, ?, ?, ?)
                 """, (key, value_json, metadata_json, now, expires_at))
                 conn.commit()
-        except (TypeError, json.JSONEncoder) as e:
+        except (TypeError, ValueError) as e:
             logger.error(f"Failed to cache value for key {key}: {e}")
     
     def delete(self, key: str):
@@ -197,3 +217,133 @@ class SQLiteCache:
     def save_to_cache(self, key: str, value: Any, metadata: Optional[Dict] = None):
         """Alias for set() to maintain compatibility with CacheManager interface."""
         self.set(key, value, metadata)
+
+
+class DiscogsResponseCache:
+    """
+    SQLite-backed cache of raw Discogs API responses keyed by request URL.
+    
+    Features:
+    - WAL-mode connection shared across calls
+    - TTL-based expiry measured from fetch time
+    - Bounded size with oldest-first eviction
+    """
+    
+    def __init__(self, db_path: str = ".cache/spotifaj.db", expiry_days: int = 7,
+                 max_entries: int = 10000):
+        """
+        Initialize the response cache.
+        
+        Args:
+            db_path: Path to SQLite database file
+            expiry_days: Entries older than this are treated as misses
+            max_entries: Maximum number of responses kept before eviction
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = expiry_days * 24 * 3600
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        
+        # Ensure cache directory exists
+        cache_dir = self.db_path.parent
+        if not cache_dir.exists():
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                logger.warning(f"Could not create cache directory {cache_dir}: {e}")
+        
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS discogs_responses (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_discogs_fetched_at 
+            ON discogs_responses(fetched_at)
+        """)
+        self._conn.commit()
+    
+    def get(self, url: str) -> Optional[Any]:
+        """
+        Get a cached response.
+        
+        Args:
+            url: Canonical request URL
+            
+        Returns:
+            Decoded response or None if not found/expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, fetched_at FROM discogs_responses WHERE url = ?",
+                (url,)
+            ).fetchone()
+        
+        if row is None:
+            return None
+        
+        body, fetched_at = row
+        if time.time() - fetched_at > self.ttl_seconds:
+            return None
+        
+        try:
+            return _loads(body)
+        except ValueError:
+            logger.error(f"Failed to decode cached response for {url}")
+            return None
+    
+    def has(self, url: str) -> bool:
+        """Check whether an unexpired response is cached, without decoding it."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM discogs_responses WHERE url = ? AND fetched_at >= ?",
+                (url, time.time() - self.ttl_seconds)
+            ).fetchone()
+        return row is not None
+    
+    def set(self, url: str, value: Any):
+        """
+        Store a successful response.
+        
+        Args:
+            url: Canonical request URL
+            value: Decoded JSON response
+        """
+        try:
+            body = _dumps(value)
+        except TypeError as e:
+            logger.error(f"Failed to cache response for {url}: {e}")
+            return
+        
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO discogs_responses (url, body, fetched_at) VALUES (?, ?, ?)",
+                (url, body, time.time())
+            )
+            # Evict the oldest entries once over capacity
+            self._conn.execute("""
+                DELETE FROM discogs_responses WHERE url IN (
+                    SELECT url FROM discogs_responses ORDER BY fetched_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+            self._conn.commit()
+    
+    def clear_expired(self):
+        """Remove all expired responses."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM discogs_responses WHERE fetched_at < ?",
+                (time.time() - self.ttl_seconds,)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+    
+    def close(self):
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
@@ -16,6 +16,7 @@ from utils.cache_manager import CacheManager
 from utils.track_verifier import TrackVerifier
 from utils.track_deduplicator import deduplicate_tracks
 from utils.sqlite_cache import SQLiteCache
+from utils.rate_limiter import get_rate_limiter
 from spotifaj_functions import _spotify_call, find_playlist_by_name, get_playlist_track_ids, add_song_to_spotify_playlist, confirm
 
 try:
@@ -25,9 +26,6 @@ except ImportError:
     RICH_AVAILABLE = False
 
 from constants import (
-    SPOTIFY_MIN_REQUEST_INTERVAL,
-    SPOTIFY_BURST_LIMIT,
-    SPOTIFY_BURST_COOLDOWN,
     CONFIDENCE_HIGH,
     CONFIDENCE_MEDIUM,
     CONFIDENCE_LOW,
@@ -38,6 +36,7 @@ from constants import (
     DISCOGS_SEARCH_PAGE_LIMIT,
     BATCH_PROCESSING_MIN_TIME,
     BATCH_COOLDOWN_BETWEEN,
+    CACHE_FILE_FORMAT,
 )
 
 logger = logging.getLogger('discogs_workflow')
@@ -60,20 +59,15 @@ class DiscogsLabelWorkflow:
         """
         self.sp = spotify_client
         self.discogs = discogs_client or get_discogs_client()
-        self.cache_manager = cache_manager or CacheManager()
+        self.cache_manager = cache_manager or CacheManager(cache_format=CACHE_FILE_FORMAT)
         self.checkpoint_cache = SQLiteCache(db_path="cache/checkpoints.db", default_expiry_days=30)
         self.verifier = TrackVerifier(spotify_client, cache_manager=self.cache_manager)
         
         # Album cache to prevent duplicate API calls (many tracks share albums)
         self.album_cache = {}
         
-        # Add Spotify-specific rate limiting
-        self.spotify_last_request_time = 0
-        self.spotify_min_request_interval = SPOTIFY_MIN_REQUEST_INTERVAL  # 2 requests per second to be safe
-        self.spotify_burst_count = 0
-        self.spotify_burst_limit = SPOTIFY_BURST_LIMIT
-        self.spotify_burst_reset_time = 0
-        self.spotify_burst_cooldown = SPOTIFY_BURST_COOLDOWN  # 1 second cooldown after hitting burst limit
+        # Spotify rate limiting shares the process-wide limiter with the Discogs client
+        self.limiter = get_rate_limiter()
         
         # Store user ID for later use
         try:
@@ -182,31 +176,7 @@ class DiscogsLabelWorkflow:
 
     def _spotify_wait_for_rate_limit(self):
         """Handle Spotify-specific rate limiting"""
-        now = time.time()
-        
-        # If we're in a burst cooldown, wait until it's over
-        if self.spotify_burst_count >= self.spotify_burst_limit:
-            if now - self.spotify_burst_reset_time < self.spotify_burst_cooldown:
-                sleep_time = self.spotify_burst_cooldown - (now - self.spotify_burst_reset_time)
-                time.sleep(sleep_time)
-                self.spotify_burst_count = 0
-                self.spotify_burst_reset_time = time.time()
-            else:
-                # Cooldown period is over
-                self.spotify_burst_count = 0
-        
-        # Apply normal request interval
-        elapsed = now - self.spotify_last_request_time
-        if elapsed < self.spotify_min_request_interval:
-            time.sleep(self.spotify_min_request_interval - elapsed)
-        
-        # Update tracking
-        self.spotify_last_request_time = time.time()
-        self.spotify_burst_count += 1
-        
-        # If we've hit the burst limit, start cooldown
-        if self.spotify_burst_count >= self.spotify_burst_limit:
-            self.spotify_burst_reset_time = time.time()
+        self.limiter.wait('spotify')
     
     def _try_spotify_search(self, query, max_retries=3):
         """Helper method to search Spotify with retries and rate limiting"""